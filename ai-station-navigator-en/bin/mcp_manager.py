@@ -484,19 +484,24 @@ class MCPManager:
                 print(f"  - {name}: {template.get('description', '无描述')}")
             return
 
+        # 颜色码绑定为局部名：循环内 LOAD_FAST 代替逐次类属性查找
+        green, warning, cyan, bold, endc = (
+            Colors.OKGREEN, Colors.WARNING, Colors.OKCYAN, Colors.BOLD, Colors.ENDC
+        )
+
         # 显示已安装的服务器
         for server in servers:
-            status = f"{Colors.OKGREEN}[启用]{Colors.ENDC}" if server["enabled"] else f"{Colors.WARNING}[禁用]{Colors.ENDC}"
-            env_indicator = f" {Colors.OKCYAN}(含环境变量){Colors.ENDC}" if server["has_env"] else ""
+            status = f"{green}[启用]{endc}" if server["enabled"] else f"{warning}[禁用]{endc}"
+            env_indicator = f" {cyan}(含环境变量){endc}" if server["has_env"] else ""
 
-            print(f"\n{status} {Colors.BOLD}{server['name']}{Colors.ENDC}{env_indicator}")
+            print(f"\n{status} {bold}{server['name']}{endc}{env_indicator}")
             print(f"  命令: {server['command']} {server['args']}")
 
         print()
         info("可用的预设模板:")
+        installed_names = {s["name"] for s in servers}
         for name, template in PRESET_TEMPLATES.items():
-            is_installed = any(s["name"] == name for s in servers)
-            status = f"{Colors.OKGREEN}[已安装]{Colors.ENDC}" if is_installed else ""
+            status = f"{green}[已安装]{endc}" if name in installed_names else ""
             print(f"  - {name}: {template.get('description', '无描述')} {status}")
 
     def add_server(self, name: str, command: str, args: List[str], env: Dict[str, str],
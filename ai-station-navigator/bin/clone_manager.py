@@ -33,14 +33,19 @@ if sys.platform == 'win32':
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 
+import functools
+import hashlib
+import itertools
 import json
 import re
 import shutil
+import stat
 import subprocess
 import tempfile
 import time
 import zipfile
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -50,6 +55,63 @@ import urllib.request
 import urllib.error
 import yaml
 
+# 可选依赖：requests 提供连接池 + keep-alive，对同一主机的多文件探测
+# 复用 TCP/TLS 连接（省去逐请求握手）；未安装时回退 urllib
+try:
+    import requests as _requests
+except ImportError:
+    _requests = None
+
+# orjson（C 实现）解析/序列化 JSON 比标准库快数倍，未安装时回退标准库
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(data) -> Any:
+    """JSON 解析；orjson 直接吃 bytes，省去一次 UTF-8 解码"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """JSON 序列化为 bytes（与 _json_loads 对称，保持缩进格式）"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+_http_session = None
+
+
+def _on_rm_error(func, path, _exc_info):
+    """shutil.rmtree 的 onerror 回调
+
+    Windows 下 git 对象文件（.git/objects/**）带只读位，直接删除
+    抛 PermissionError；清掉只读位后重试一次，仍失败则异常照常
+    传给调用方的 try/except。
+    """
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _get_http_session():
+    """惰性构建共享的 requests.Session（requests 未安装时返回 None）"""
+    global _http_session
+    if _http_session is None and _requests is not None:
+        session = _requests.Session()
+        adapter = _requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=20, max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
 # =============================================================================
 # 路径配置
 # =============================================================================
@@ -58,10 +120,13 @@ BASE_DIR = Path(__file__).parent.parent
 CACHE_DIR = BASE_DIR / "mybox" / "cache" / "repos"
 TEMP_DIR = BASE_DIR / "mybox" / "temp"
 
+# GitHub URL 识别前缀（validate_github_url 也只接受这两种形态）
+_GITHUB_URL_PREFIXES = ("https://github.com/", "http://github.com/")
+
 # 技能默认值常量
 DEFAULT_SKILL_DESC = "无描述"
 DEFAULT_SKILL_CATEGORY = "utilities"
-DEFAULT_SKILL_TAGS = ["skill"]
+DEFAULT_SKILL_TAGS = ("skill",)
 
 # 添加项目 lib 目录到 sys.path（绿色包预置依赖）
 _lib_dir = Path(__file__).parent.parent / "lib"
@@ -99,7 +164,7 @@ def error(msg: str):
 # =============================================================================
 
 _config_cache: Optional[dict] = None
-_config_mtime: Optional[float] = None
+_config_mtime_ns: Optional[int] = None
 
 def load_config(use_cache: bool = True) -> dict:
     """
@@ -115,29 +180,27 @@ def load_config(use_cache: bool = True) -> dict:
     Returns:
         配置字典
     """
-    global _config_cache, _config_mtime
+    global _config_cache, _config_mtime_ns
 
-    # 配置文件路径列表（按优先级）
-    config_files = [
-        BASE_DIR / "config.json",
-        BASE_DIR / ".claude" / "config" / "config.yml"
-    ]
-
-    # 查找存在的配置文件
+    # 配置文件路径列表（按优先级）；单次 os.stat 同时完成存在性探测
+    # 和 mtime 读取（纳秒整数比较，避免浮点时间戳取整造成的假未命中）
     config_file = None
-    for cf in config_files:
-        if cf.exists():
+    st = None
+    for cf in (BASE_DIR / "config.json",
+               BASE_DIR / ".claude" / "config" / "config.yml"):
+        try:
+            st = os.stat(cf)
             config_file = cf
             break
+        except OSError:
+            continue
 
-    if not config_file:
+    if config_file is None:
         return {}
 
     # 检查缓存有效性
-    if use_cache and _config_cache is not None:
-        current_mtime = config_file.stat().st_mtime
-        if current_mtime == _config_mtime:
-            return _config_cache
+    if use_cache and _config_cache is not None and st.st_mtime_ns == _config_mtime_ns:
+        return _config_cache
 
     # 加载配置（根据文件类型选择加载方式）
     try:
@@ -146,7 +209,7 @@ def load_config(use_cache: bool = True) -> dict:
                 _config_cache = json.load(f)
             else:
                 _config_cache = yaml.safe_load(f) or {}
-            _config_mtime = config_file.stat().st_mtime
+            _config_mtime_ns = st.st_mtime_ns
             return _config_cache
     except Exception as e:
         warn(f"配置文件加载失败: {e}")
@@ -154,9 +217,9 @@ def load_config(use_cache: bool = True) -> dict:
 
 def clear_config_cache() -> None:
     """清除配置缓存"""
-    global _config_cache, _config_mtime
+    global _config_cache, _config_mtime_ns
     _config_cache = None
-    _config_mtime = None
+    _config_mtime_ns = None
 
 def get_git_proxies() -> list:
     """获取 Git 加速器列表"""
@@ -186,6 +249,12 @@ def get_raw_proxies() -> list:
 class FormatDetector:
     """检测输入源的格式类型"""
 
+    # 预编译：每次校验省去 re 模块缓存查找和模式重解析
+    _GITHUB_URL_RE = re.compile(
+        r'^https?://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+'
+        r'(?:/tree/[^/\s]+(?:/[\w\-./]+)?)?/?$'
+    )
+
     @staticmethod
     def validate_github_url(url: str) -> Tuple[bool, Optional[str]]:
         """
@@ -198,8 +267,7 @@ class FormatDetector:
             (是否有效, 错误信息)
         """
         # 基础格式检查
-        github_pattern = r'^https?://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+(?:/tree/[^/\s]+(?:/[\w\-./]+)?)?/?$'
-        if not re.match(github_pattern, url):
+        if not FormatDetector._GITHUB_URL_RE.match(url):
             return False, f"无效的 GitHub URL 格式: {url}"
 
         # 检查危险的 git 配置注入模式
@@ -231,20 +299,22 @@ class FormatDetector:
         if not is_valid:
             raise ValueError(f"GitHub URL 安全验证失败: {error_msg}")
 
-        parsed = urlparse(github_url)
-        path_parts = parsed.path.strip('/').split('/')
+        # 纯字符串切分代替 urlparse：验证已保证 https?://github.com/... 形态，
+        # 无需构造 ParseResult
+        scheme, _, rest = github_url.partition("://")
+        # parts = [github.com, owner, repo, 'tree', branch, ...]
+        parts = rest.strip('/').split('/')
 
-        # 查找 /tree/ 分隔符
-        if 'tree' in path_parts:
-            tree_idx = path_parts.index('tree')
-            if tree_idx >= 2:
-                repo_url = f"{parsed.scheme}://{parsed.netloc}/{'/'.join(path_parts[:tree_idx])}"
-                if len(path_parts) > tree_idx + 2:
-                    subpath = '/'.join(path_parts[tree_idx + 2:])
-                    return repo_url, subpath
-                return repo_url, None
+        # 查找 /tree/ 分隔符（至少位于 owner/repo 之后）
+        try:
+            tree_idx = parts.index('tree', 3)
+        except ValueError:
+            return github_url, None
 
-        return github_url, None
+        repo_url = f"{scheme}://{'/'.join(parts[:tree_idx])}"
+        if len(parts) > tree_idx + 2:
+            return repo_url, '/'.join(parts[tree_idx + 2:])
+        return repo_url, None
 
     @staticmethod
     def detect_input_type(input_source: str) -> Tuple[str, str, Optional[str]]:
@@ -256,14 +326,12 @@ class FormatDetector:
         """
         info(f"检测输入源: {input_source}")
 
-        # 1. 检查是否是 GitHub URL
-        if input_source.startswith(("http://", "https://")):
-            parsed = urlparse(input_source)
-            if "github.com" in parsed.netloc:
-                repo_url, subpath = FormatDetector.parse_github_subpath(input_source)
-                if subpath:
-                    info(f"检测到子路径: {subpath}")
-                return "github", repo_url, subpath
+        # 1. 检查是否是 GitHub URL（前缀比较即可，省去 urlparse）
+        if input_source.startswith(_GITHUB_URL_PREFIXES):
+            repo_url, subpath = FormatDetector.parse_github_subpath(input_source)
+            if subpath:
+                info(f"检测到子路径: {subpath}")
+            return "github", repo_url, subpath
 
         # 1.5 检查是否是 GitHub 简写 (user/repo)
         if "/" in input_source and not input_source.startswith((".", "/", "\\")):
@@ -294,37 +362,83 @@ class FormatDetector:
 # 技能标准化器（提取所需部分）
 # =============================================================================
 
+@functools.lru_cache(maxsize=512)
+def _extract_frontmatter_cached(content: str) -> Dict[str, Any]:
+    """extract_frontmatter 的实际实现（按内容缓存）
+
+    同一会话内重复分析同一仓库时，相同内容直接命中缓存，
+    跳过重复的 YAML 解析。
+    """
+    if not content.startswith("---"):
+        return {}
+
+    # CRLF 归一化：Windows 下 core.autocrlf 检出的仓库里 frontmatter
+    # 是 ---\r\n 开头，直接 partition "---\n" 会匹配失败
+    if "\r" in content:
+        content = content.replace("\r\n", "\n")
+
+    # partition 一次定位两个分隔符，比逐字符 find/切片更省
+    _, sep, rest = content.partition("---\n")
+    if not sep:
+        return {}
+    yaml_content, sep, _ = rest.partition("\n---")
+    if not sep:
+        return {}
+    yaml_content = yaml_content.strip()
+
+    try:
+        frontmatter = yaml.safe_load(yaml_content)
+        if isinstance(frontmatter, dict):
+            return frontmatter
+    except (yaml.YAMLError, Exception):
+        pass
+
+    # 降级：手动解析
+    result = {}
+    for line in yaml_content.splitlines():
+        key, sep, value = line.partition(':')
+        if sep and not key.lstrip().startswith('#'):
+            result[key.strip()] = value.strip().strip('"').strip("'")
+    return result
+
+
+#: SKILL.md 头部读取窗口：frontmatter 通常远小于 8KB，大文件只读头部
+_FRONTMATTER_SCAN_BYTES = 8192
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_skill_md_cached(path: str, mtime_ns: int, size: int) -> str:
+    """按 (路径, mtime, size) 缓存的 SKILL.md 读取
+
+    同进程内重复 analyze() 同一缓存仓库时免重复读盘；文件变化后
+    stat 身份改变，缓存自动失效。解析侧已按内容缓存，二者叠加后
+    热路径零 I/O 零重解析。
+
+    解析只消费顶部 frontmatter，超过窗口的大文件先读 8KB：
+    frontmatter 在窗口内闭合（或根本没有 frontmatter）时头部
+    即够用，闭合跨出窗口的罕见情况才整读兜底。
+    """
+    if size > _FRONTMATTER_SCAN_BYTES:
+        with open(path, "rb") as f:
+            head = f.read(_FRONTMATTER_SCAN_BYTES)
+        if not head.startswith(b"---"):
+            return head.decode("utf-8", errors="ignore").replace("\r\n", "\n")
+        end = head.find(b"\n---", 4)
+        if end > 0:
+            return head[:end + 4].decode("utf-8", errors="ignore").replace("\r\n", "\n")
+    with open(path, "rb") as f:
+        # 二进制读没有文本模式的通用换行翻译，解码后手动归一 CRLF，
+        # Windows 检出的缓存仓库内容与基线行为保持一致
+        return f.read().decode("utf-8", errors="ignore").replace("\r\n", "\n")
+
+
 class SkillNormalizer:
     """将各种格式标准化为官方 SKILL.md 格式"""
 
     @staticmethod
     def extract_frontmatter(content: str) -> Dict[str, Any]:
         """从 SKILL.md 提取 YAML frontmatter"""
-        if not content.startswith("---"):
-            return {}
-
-        end_marker = content.find("\n---", 4)
-        if end_marker == -1:
-            end_marker = content.find("---", 3)
-        if end_marker <= 0:
-            return {}
-
-        yaml_content = content[4:end_marker].strip()
-
-        try:
-            frontmatter = yaml.safe_load(yaml_content)
-            if isinstance(frontmatter, dict):
-                return frontmatter
-        except (yaml.YAMLError, Exception):
-            pass
-
-        # 降级：手动解析
-        result = {}
-        for line in yaml_content.split('\n'):
-            if ':' in line and not line.strip().startswith('#'):
-                key, value = line.split(':', 1)
-                result[key.strip()] = value.strip().strip('"').strip("'")
-        return result
+        return _extract_frontmatter_cached(content)
 
 # =============================================================================
 # 项目验证器
@@ -348,17 +462,24 @@ class ProjectValidator:
 class SkillPackHandler:
     """处理 .skill 技能包"""
 
+    # 解压时跳过的路径片段：对技能识别/安装无用，只会放大磁盘写入
+    # 和后续目录扫描成本
+    EXTRACT_SKIP_PATTERNS = ("__pycache__/", "node_modules/", ".git/", ".pyc")
+
     @staticmethod
     def extract_pack(pack_file: Path, extract_dir: Path) -> Tuple[bool, Optional[Path]]:
         """
-        解压 .skill 技能包
+        解压 .skill 技能包（流式逐成员解压，过滤无用文件）
 
         Returns:
             (成功, 解压目录)
         """
         try:
             with zipfile.ZipFile(pack_file, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+                for member in zip_ref.infolist():
+                    if any(p in member.filename for p in SkillPackHandler.EXTRACT_SKIP_PATTERNS):
+                        continue
+                    zip_ref.extract(member, extract_dir)
             return True, extract_dir
         except Exception as e:
             error(f"解压技能包失败: {e}")
@@ -374,21 +495,46 @@ class RemoteSkillAnalyzer:
     API_BASE = "https://api.github.com"
     RAW_BASE = "https://raw.githubusercontent.com"
 
-    def __init__(self, repo: str, branch: str = "main", token: Optional[str] = None):
+    #: 代理失败后的冷却秒数，冷却期内跳过、到期后允许重新探测
+    _PROXY_RETRY_INTERVAL = 60.0
+    #: 负缓存有效期（秒）与容量上限：记住"确认不存在"的路径
+    _NEG_CACHE_TTL = 60.0
+    _NEG_CACHE_MAX = 256
+
+    def __init__(self, repo: str, branch: str = "main", token: Optional[str] = None,
+                 tokens: Optional[List[str]] = None):
         """
         Args:
             repo: user/repo 格式
             branch: 分支名
             token: GitHub personal access token
+            tokens: 多个 token 轮询使用，速率限额按 N 倍放大
         """
         self.repo = repo
         self.branch = branch
-        self.token = token or os.environ.get("GITHUB_TOKEN")
+        token_pool = [t for t in (tokens or []) if t]
+        self.token = token or (token_pool[0] if token_pool else None) \
+            or os.environ.get("GITHUB_TOKEN")
+        self._token_iter = itertools.cycle(token_pool) if token_pool else None
         self._use_cache = True
         self.github_url = f"https://github.com/{repo}"
         self.proxies = get_raw_proxies()
         self._cache = {}
+        self._neg_cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
         self._working_proxy = None
+        self._proxy_failed_at: Dict[str, float] = {}
+        self._tree_cache: Dict[str, Optional[List[str]]] = {}
+
+    def _next_token(self) -> Optional[str]:
+        """取下一个可用 token：多 token 轮询，单 token 原样返回"""
+        if self._token_iter is not None:
+            return next(self._token_iter)
+        return self.token
+
+    def _proxy_usable(self, proxy_template: str) -> bool:
+        """近期失败过且仍在冷却期内的代理跳过，避免反复撞坏节点"""
+        failed_at = self._proxy_failed_at.get(proxy_template)
+        return failed_at is None or time.time() - failed_at >= self._PROXY_RETRY_INTERVAL
 
     def analyze(self) -> Dict[str, Any]:
         """分析仓库，返回技能信息"""
@@ -412,23 +558,46 @@ class RemoteSkillAnalyzer:
         result["source"] = "network"
         return self._analyze_from_network(result)
 
+    # 缓存扫描时原地剪掉的目录：不含技能且条目量大
+    _SCAN_PRUNE_DIRS = {".git", "node_modules", "__pycache__", ".venv", "dist", "build"}
+
     def _analyze_from_cache(self, cache_dir: Path, result: Dict) -> Dict:
-        """从本地缓存分析仓库"""
-        skills = []
-        for skill_md in cache_dir.rglob("SKILL.md"):
-            rel_path = skill_md.relative_to(cache_dir)
+        """从本地缓存分析仓库
+
+        rglob 会为每个条目构造 Path 并深入 .git/node_modules 等无关
+        目录；os.walk + 原地剪枝只扫有用子树，目录项来自 scandir，
+        无逐项额外 stat。二进制读取跳过文本模式的编码协商。
+        """
+        root_str = str(cache_dir)
+        jobs = []  # (SKILL.md 绝对路径, 相对父目录)
+        for root, dirs, files in os.walk(root_str):
+            dirs[:] = [d for d in dirs if d not in self._SCAN_PRUNE_DIRS]
+            if "SKILL.md" in files:
+                jobs.append((os.path.join(root, "SKILL.md"),
+                             os.path.relpath(root, root_str)))
+
+        def _read_and_parse(job: Tuple[str, str]) -> Optional[Dict]:
+            path, rel_parent = job
             try:
-                with open(skill_md, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                info = self._parse_skill_md(content, str(rel_path.parent))
+                st = os.stat(path)
+                content = _read_skill_md_cached(path, st.st_mtime_ns, st.st_size)
+                info = self._parse_skill_md(content, rel_parent)
                 if info:
-                    info["url"] = f"{self.github_url}/tree/{result['branch']}/{rel_path.parent}"
-                    info["is_root"] = (str(rel_path.parent) == ".")
-                    skills.append(info)
+                    info["url"] = f"{self.github_url}/tree/{result['branch']}/{rel_parent}"
+                    info["is_root"] = (rel_parent == ".")
+                return info
             except Exception as e:
-                warn(f"读取 {rel_path} 失败: {e}")
+                warn(f"读取 {os.path.join(rel_parent, 'SKILL.md')} 失败: {e}")
+                return None
 
-        result["skills"] = sorted(skills, key=lambda x: x["name"])
+        # 多技能缓存时读取+解析并行：文件读取释放 GIL，线程重叠 I/O
+        if len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+                parsed = list(executor.map(_read_and_parse, jobs))
+        else:
+            parsed = [_read_and_parse(job) for job in jobs]
+
+        result["skills"] = sorted((i for i in parsed if i), key=lambda x: x["name"])
         return result
 
     def _analyze_from_network(self, result: Dict) -> Dict:
@@ -439,15 +608,32 @@ class RemoteSkillAnalyzer:
         branches_to_try = ["main", "master"]
         found_branch = None
 
+        # 分支探测只需要存在性信号，HEAD 请求即可；四个 分支×文件
+        # 组合并发探测，总延迟从 RTT 之和降为 max(RTT)。
+        # 选择仍按 branches_to_try 顺序，main 优先，结果确定
+        hit_branches = set()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(self.exists, file_path, branch): branch
+                for branch in branches_to_try
+                for file_path in ("SKILL.md", "README.md")
+            }
+            for future in as_completed(futures):
+                try:
+                    if future.result():
+                        hit_branches.add(futures[future])
+                except Exception:
+                    pass
         for branch in branches_to_try:
-            self.branch = branch
-            if self.fetch_file("SKILL.md") or self.fetch_file("README.md"):
+            if branch in hit_branches:
                 found_branch = branch
                 break
 
         if not found_branch:
             return result
 
+        self.branch = found_branch
+
         result["branch"] = found_branch
 
         # 检测根目录 SKILL.md
@@ -461,6 +647,17 @@ class RemoteSkillAnalyzer:
 
         # 探测子技能
         sub_skill_paths = self._discover_skill_paths()
+
+        # 有 token 时把未缓存的内容合并为一次 GraphQL 批量请求，
+        # 失败时 fetch_file 自动逐文件降级
+        missing = [p for p in sub_skill_paths if p not in self._cache]
+        if self.token and len(missing) > 1:
+            batch = self._fetch_files_graphql(missing)
+            if batch:
+                for path, text in batch.items():
+                    if text:
+                        self._cache[path] = text
+
         for path in sub_skill_paths:
             content = self.fetch_file(path)
             if content:
@@ -474,10 +671,40 @@ class RemoteSkillAnalyzer:
         result["skills"] = sorted(skills, key=lambda x: x["name"])
         return result
 
+    def _list_tree(self) -> Optional[List[str]]:
+        """单次递归 Trees API 拉取全仓 blob 路径清单
+
+        结果按分支缓存在分析器实例上；请求失败或响应被截断
+        （truncated，超大仓库）时返回 None，调用方降级为逐路径探测。
+        """
+        if self.branch in self._tree_cache:
+            return self._tree_cache[self.branch]
+
+        paths: Optional[List[str]] = None
+        data = self._api_json(
+            f"{self.API_BASE}/repos/{self.repo}/git/trees/{self.branch}?recursive=1"
+        )
+        if isinstance(data, dict) and not data.get("truncated"):
+            tree = data.get("tree")
+            if isinstance(tree, list):
+                paths = [
+                    entry.get("path", "")
+                    for entry in tree
+                    if entry.get("type") == "blob"
+                ]
+        self._tree_cache[self.branch] = paths
+        return paths
+
     def _discover_skill_paths(self) -> List[str]:
-        """探测子技能 SKILL.md 路径"""
-        skill_paths = []
-        checked = set()
+        """探测子技能 SKILL.md 路径（优先 Trees API，回退并发探测）"""
+        # 一次 tree 请求替代 ~39 次逐候选探测：API 配额省一个量级，
+        # 且能发现候选名单之外的所有子技能
+        tree_paths = self._list_tree()
+        if tree_paths is not None:
+            return sorted(
+                path for path in tree_paths
+                if path.endswith("/SKILL.md")
+            )
 
         # 常见技能名称
         common_names = [
@@ -486,25 +713,85 @@ class RemoteSkillAnalyzer:
             "translator", "summarizer", "code-run", "terminal"
         ]
 
-        patterns = [
-            "plugins/{name}/SKILL.md",
-            "skills/{name}/SKILL.md",
-            "{name}/SKILL.md",
-        ]
-
-        names_to_check = common_names
-
+        # 先各花一次 HEAD 确认 plugins/、skills/ 顶层目录是否存在：
+        # 目录明确缺失（404）即剪掉整组候选（每组 13 个探测）；
+        # 探测结果不确定（网络/配额问题）时保守保留该组
+        dir_present: Dict[str, Optional[bool]] = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(self._probe_remote_dir, d): d
+                for d in ("plugins", "skills")
+            }
+            for future in as_completed(futures):
+                try:
+                    dir_present[futures[future]] = future.result()
+                except Exception:
+                    dir_present[futures[future]] = None
+
+        patterns = ["{name}/SKILL.md"]
+        if dir_present.get("skills") is not False:
+            patterns.insert(0, "skills/{name}/SKILL.md")
+        if dir_present.get("plugins") is not False:
+            patterns.insert(0, "plugins/{name}/SKILL.md")
+
+        # 先生成去重候选，再并发探测：每个探测是一次网络往返，串行
+        # 耗时为 RTT 之和，并发后趋近 max(RTT)。并发数压在 8 以内，
+        # 避免触发 GitHub 二级限流
+        candidates = []
+        seen = set()
         for pattern in patterns:
-            for name in names_to_check:
+            for name in common_names:
                 path = pattern.replace("{name}", name)
-                if path in checked:
-                    continue
-                if self.fetch_file(path):
-                    skill_paths.append(path)
-                    checked.add(path)
+                if path not in seen:
+                    seen.add(path)
+                    candidates.append(path)
+
+        skill_paths = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(self.fetch_file, p): p for p in candidates}
+            for future in as_completed(futures):
+                try:
+                    if future.result():
+                        skill_paths.append(futures[future])
+                except Exception:
+                    pass
 
         return sorted(skill_paths)
 
+    def _probe_remote_dir(self, dirname: str) -> Optional[bool]:
+        """HEAD contents API 判断顶层目录是否存在
+
+        Returns:
+            True 存在 / False 确认不存在（404）/ None 无法判断
+        """
+        url = f"{self.API_BASE}/repos/{self.repo}/contents/{dirname}?ref={self.branch}"
+        headers = {}
+        token = self._next_token()
+        if token:
+            headers["Authorization"] = f"token {token}"
+        session = _get_http_session()
+        if session is not None:
+            try:
+                resp = session.head(url, headers=headers, timeout=(3, 5))
+                if resp.status_code == 200:
+                    return True
+                if resp.status_code == 404:
+                    return False
+            except Exception:
+                pass
+            return None
+        try:
+            req = urllib.request.Request(url, headers=headers, method="HEAD")
+            with urllib.request.urlopen(req, timeout=5) as response:
+                if 200 <= response.status < 300:
+                    return True
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return False
+        except Exception:
+            pass
+        return None
+
     def _parse_skill_md(self, content: str, file_path: str) -> Optional[Dict]:
         """解析 SKILL.md 内容"""
         frontmatter = SkillNormalizer.extract_frontmatter(content)
@@ -522,7 +809,7 @@ class RemoteSkillAnalyzer:
             "folder": file_path.replace("\\", "/") if file_path else "",
             "description": frontmatter.get("description", DEFAULT_SKILL_DESC),
             "category": frontmatter.get("category", DEFAULT_SKILL_CATEGORY),
-            "tags": frontmatter.get("tags", DEFAULT_SKILL_TAGS.copy())
+            "tags": frontmatter.get("tags", list(DEFAULT_SKILL_TAGS))
         }
 
     @staticmethod
@@ -544,6 +831,17 @@ class RemoteSkillAnalyzer:
         if file_path in self._cache:
             return self._cache[file_path]
 
+        # 负缓存：TTL 内再次请求已确认缺失的路径直接短路，
+        # check_is_skill_repo 之后的 analyze 不再重复探测同一文件。
+        # 键带上分支：self.branch 在 main/master 探测间会被改写，
+        # main 下的缺失不能掩盖 master 下存在的同名文件
+        neg_key = (self.branch, file_path)
+        neg_expiry = self._neg_cache.get(neg_key)
+        if neg_expiry is not None:
+            if time.time() < neg_expiry:
+                return None
+            del self._neg_cache[neg_key]
+
         if prefer_api and self.token:
             content = self._fetch_via_api(file_path)
             if content is not None:
@@ -561,6 +859,11 @@ class RemoteSkillAnalyzer:
                 self._cache[file_path] = content
                 return content
 
+        # 所有渠道都没拿到：记入负缓存，容量超限时淘汰最旧条目
+        self._neg_cache[neg_key] = time.time() + self._NEG_CACHE_TTL
+        self._neg_cache.move_to_end(neg_key)
+        while len(self._neg_cache) > self._NEG_CACHE_MAX:
+            self._neg_cache.popitem(last=False)
         return None
 
     def _fetch_via_raw(self, file_path: str) -> Optional[str]:
@@ -572,22 +875,85 @@ class RemoteSkillAnalyzer:
             content = self._try_fetch_url(proxy_url)
             if content is not None:
                 return content
+            # 降级而非永久丢弃：记录失败时间，冷却期后可重新探测
+            self._proxy_failed_at[self._working_proxy] = time.time()
             self._working_proxy = None
 
         for proxy_template in self.proxies:
+            if not self._proxy_usable(proxy_template):
+                continue
             proxy_url = proxy_template.replace("{path}", path)
             content = self._try_fetch_url(proxy_url)
             if content is not None:
+                self._proxy_failed_at.pop(proxy_template, None)
                 self._working_proxy = proxy_template
                 return content
 
         raw_url = f"{self.RAW_BASE}/{path}"
         return self._try_fetch_url(raw_url)
 
+    def _head_ok(self, url: str) -> bool:
+        """HEAD 探测 URL 是否可访问（不下载响应体）"""
+        if not self._validate_url(url):
+            return False
+        session = _get_http_session()
+        if session is not None:
+            try:
+                resp = session.head(url, timeout=(3, 5), allow_redirects=True)
+                return 200 <= resp.status_code < 300
+            except Exception:
+                return False
+        try:
+            req = urllib.request.Request(url, method="HEAD")
+            with urllib.request.urlopen(req, timeout=5) as response:
+                return 200 <= response.status < 300
+        except Exception:
+            return False
+
+    def exists(self, file_path: str, branch: Optional[str] = None) -> bool:
+        """检查远程文件是否存在 - 仅发 HEAD 请求，不传输文件内容
+
+        分支探测等只关心 200/404 信号的场景用它代替 fetch_file，
+        避免为存在性检查下载完整文件体。branch 缺省用当前分支，
+        并发分支探测时由调用方显式传入。
+        """
+        if branch is None and file_path in self._cache:
+            return True
+
+        path = f"{self.repo}/{branch or self.branch}/{file_path}"
+
+        if self._working_proxy:
+            if self._head_ok(self._working_proxy.replace("{path}", path)):
+                return True
+
+        for proxy_template in self.proxies:
+            if proxy_template == self._working_proxy:
+                continue
+            # HEAD 失败无法区分文件不存在和代理故障，这里只跳过冷却中的代理
+            if not self._proxy_usable(proxy_template):
+                continue
+            if self._head_ok(proxy_template.replace("{path}", path)):
+                self._working_proxy = proxy_template
+                return True
+
+        return self._head_ok(f"{self.RAW_BASE}/{path}")
+
     def _try_fetch_url(self, url: str) -> Optional[str]:
         """尝试从指定 URL 获取文件（跨平台兼容）"""
         if not self._validate_url(url):
             return None
+        session = _get_http_session()
+        if session is not None:
+            try:
+                resp = session.get(url, timeout=(3, 5))
+                if resp.status_code != 200:
+                    return None
+                content = resp.content.decode("utf-8", errors="replace")
+            except Exception:
+                return None
+            if not content or "404: Not Found" in content or "<title>404" in content:
+                return None
+            return content
         try:
             with urllib.request.urlopen(url, timeout=5) as response:
                 content = response.read().decode("utf-8", errors="replace")
@@ -599,11 +965,45 @@ class RemoteSkillAnalyzer:
         return None
 
     def _fetch_via_api(self, file_path: str) -> Optional[str]:
-        """通过 GitHub API 获取文件（跨平台兼容）"""
+        """通过 GitHub API 获取文件（跨平台兼容，带 ETag 条件请求）
+
+        上次响应的 ETag 以 If-None-Match 回送：命中 304 时直接取本地
+        缓存体，不传输文件内容，且 304 不计入 GitHub API 配额。
+        """
         url = f"{self.API_BASE}/repos/{self.repo}/contents/{file_path}"
         headers = {"Accept": "application/vnd.github.v3.raw"}
-        if self.token:
-            headers["Authorization"] = f"token {self.token}"
+        token = self._next_token()
+        if token:
+            headers["Authorization"] = f"token {token}"
+
+        etags = RepoCacheManager.get_etag_map()
+        if url in etags:
+            headers["If-None-Match"] = etags[url]
+
+        session = _get_http_session()
+        if session is not None:
+            try:
+                resp = session.get(url, headers=headers, timeout=(3, 5))
+                if resp.status_code == 304:
+                    cached = RepoCacheManager.load_etag_body(url)
+                    if cached is not None:
+                        return cached
+                    # 缓存体丢失：清掉过期 ETag 无条件重试一次
+                    headers.pop("If-None-Match", None)
+                    RepoCacheManager.drop_etag(url)
+                    resp = session.get(url, headers=headers, timeout=(3, 5))
+                if resp.status_code != 200:
+                    return None
+                # Accept 要求 raw，正常响应就是文件本体，无需 JSON 嗅探；
+                # 仅当服务端仍回 JSON 包装（Content-Type 标明）才走解包
+                if "application/json" in resp.headers.get("Content-Type", ""):
+                    content = self._decode_api_content(resp.text)
+                else:
+                    content = resp.content.decode("utf-8", errors="replace")
+                RepoCacheManager.store_etag(url, resp.headers.get("ETag"), content)
+                return content
+            except Exception:
+                return None
 
         try:
             req = urllib.request.Request(url, headers=headers)
@@ -612,26 +1012,186 @@ class RemoteSkillAnalyzer:
                 if response.status == 403:
                     return None
 
-                content = response.read().decode("utf-8", errors="replace")
-                if content.startswith("{"):
-                    try:
-                        import base64
-                        data = json.loads(content)
-                        if "content" in data:
-                            return base64.b64decode(data["content"]).decode("utf-8", errors="ignore")
-                    except Exception:
-                        pass
+                content = self._decode_api_content(
+                    response.read().decode("utf-8", errors="replace")
+                )
+                RepoCacheManager.store_etag(url, response.headers.get("ETag"), content)
                 return content
         except (urllib.error.HTTPError, urllib.error.URLError) as e:
-            if hasattr(e, 'code') and e.code == 403:
+            if getattr(e, 'code', None) == 304:
+                cached = RepoCacheManager.load_etag_body(url)
+                if cached is not None:
+                    return cached
+                RepoCacheManager.drop_etag(url)
+            return None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _decode_api_content(content: str) -> Optional[str]:
+        """contents API 响应解码（JSON 包装时取出 base64 内容）"""
+        if content.startswith("{"):
+            try:
+                import base64
+                data = json.loads(content)
+                if "content" in data:
+                    return base64.b64decode(data["content"]).decode("utf-8", errors="ignore")
+            except Exception:
+                pass
+        return content
+
+    def _post_json(self, url: str, payload: Dict) -> Optional[Any]:
+        """POST JSON 并解析响应（GraphQL 端点用）"""
+        headers = {"Content-Type": "application/json"}
+        token = self._next_token()
+        if token:
+            headers["Authorization"] = f"bearer {token}"
+        body = json.dumps(payload).encode("utf-8")
+        session = _get_http_session()
+        if session is not None:
+            try:
+                resp = session.post(url, data=body, headers=headers, timeout=(3, 10))
+                if resp.status_code != 200:
+                    return None
+                return resp.json()
+            except Exception:
                 return None
+        try:
+            req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+            with urllib.request.urlopen(req, timeout=10) as response:
+                return _json_loads(response.read())
+        except Exception:
             return None
+
+    def _fetch_files_graphql(self, paths: List[str]) -> Optional[Dict[str, Optional[str]]]:
+        """单次 GraphQL 请求批量拉取多个文件内容（需要 token）
+
+        N 个文件从 N 次 REST 往返合并为 1 次 POST，按别名映射回
+        路径；请求失败返回 None，由调用方降级为逐文件获取。
+        """
+        if not self.token or not paths:
+            return None
+        owner, _, name = self.repo.partition("/")
+        fields = " ".join(
+            f"f{i}: object(expression: {json.dumps(f'{self.branch}:{path}')}) "
+            "{ ... on Blob { text } }"
+            for i, path in enumerate(paths)
+        )
+        query = (
+            f"query {{ repository(owner: {json.dumps(owner)}, "
+            f"name: {json.dumps(name)}) {{ {fields} }} }}"
+        )
+        data = self._post_json(f"{self.API_BASE}/graphql", {"query": query})
+        if not isinstance(data, dict):
+            return None
+        repo_data = (data.get("data") or {}).get("repository")
+        if not isinstance(repo_data, dict):
+            return None
+        return {
+            path: (repo_data.get(f"f{i}") or {}).get("text")
+            for i, path in enumerate(paths)
+        }
+
+    def _api_json(self, url: str) -> Optional[Any]:
+        """GET GitHub API 并解析 JSON 响应"""
+        headers = {"Accept": "application/vnd.github.v3+json"}
+        token = self._next_token()
+        if token:
+            headers["Authorization"] = f"token {token}"
+        session = _get_http_session()
+        if session is not None:
+            try:
+                resp = session.get(url, headers=headers, timeout=(3, 10))
+                if resp.status_code != 200:
+                    return None
+                return resp.json()
+            except Exception:
+                return None
+        try:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=10) as response:
+                return _json_loads(response.read())
+        except Exception:
+            return None
+
+    def _fetch_bytes(self, url: str) -> Optional[bytes]:
+        """下载原始字节内容（用于二进制资源文件）"""
+        if not self._validate_url(url):
+            return None
+        session = _get_http_session()
+        if session is not None:
+            try:
+                resp = session.get(url, timeout=(3, 10))
+                return resp.content if resp.status_code == 200 else None
+            except Exception:
+                return None
+        try:
+            with urllib.request.urlopen(url, timeout=10) as response:
+                return response.read()
         except Exception:
             return None
 
+    def download_subtree(self, folder: str, dest: Path) -> bool:
+        """通过 REST contents API 下载指定子目录（无需 git clone）
+
+        Args:
+            folder: 仓库内的相对路径
+            dest: 本地目标目录
+
+        Returns:
+            是否完整下载
+        """
+        listing = self._api_json(
+            f"{self.API_BASE}/repos/{self.repo}/contents/{folder}?ref={self.branch}"
+        )
+        if not isinstance(listing, list):
+            return False
+
+        dest.mkdir(parents=True, exist_ok=True)
+        ok = True
+        for item in listing:
+            item_type = item.get("type")
+            name = item.get("name", "")
+            if not name:
+                continue
+            if item_type == "dir":
+                ok = self.download_subtree(item.get("path", ""), dest / name) and ok
+            elif item_type == "file":
+                data = self._fetch_bytes(item.get("download_url") or "")
+                if data is None:
+                    ok = False
+                    continue
+                (dest / name).write_bytes(data)
+        return ok
+
     def check_is_skill_repo(self) -> Tuple[Optional[bool], str]:
-        """统一的技能仓库预检"""
-        # 尝试 Raw URL
+        """统一的技能仓库预检
+
+        优先用一次递归 Trees API 调用在内存里回答全部谓词：根目录
+        或任意子目录有无 SKILL.md 一并判定，替代逐文件网络探测；
+        树不可拿（无 API 配额 / 超大仓库截断）时回退 Raw 探测。
+        """
+        tree_paths = self._list_tree()
+        if tree_paths is not None:
+            paths = set(tree_paths)
+            if "SKILL.md" in paths:
+                return True, f"树列表发现 SKILL.md (分支: {self.branch})"
+            if any(p.endswith("/SKILL.md") for p in paths):
+                return True, f"树列表发现子目录 SKILL.md (分支: {self.branch})"
+            # 无 SKILL.md 但有其他受支持的安装格式标记（.skill 技能包 /
+            # cursor-rules / claude-plugin）：交给 clone 流程识别转换
+            if any(
+                p.endswith(".skill") or p.endswith("plugin.json")
+                or p == ".cursorrules" or p.startswith("rules/")
+                for p in paths
+            ):
+                return None, "树列表无 SKILL.md，发现其他受支持格式，降级到 clone"
+            # 树列表完整、无 SKILL.md 且带工具项目特征，可确定地排除
+            if any(p in paths for p in ProjectValidator.TOOL_PROJECT_FILES):
+                return False, "树列表无 SKILL.md，且为工具项目特征"
+            return None, "树列表未发现 SKILL.md，降级到 clone"
+
+        # 降级：Raw URL 逐文件探测
         content = self.fetch_file("SKILL.md")
         if content:
             return True, f"Raw 发现 SKILL.md (分支: {self.branch})"
@@ -719,16 +1279,33 @@ class RepoCacheManager:
 
     @staticmethod
     def _sanitize_url(url: str) -> str:
-        """将 URL 转换为安全的目录名"""
+        """将 URL 转换为安全目录名：仓库名 slug + URL 哈希
+
+        旧实现整串替换后截断到 100 字符，前缀相同的超长 URL 会
+        互相碰撞；改为末段 slug 加 blake2b 摘要，定长且无碰撞，
+        目录名仍可读出是哪个仓库。
+        """
+        slug = re.sub(r"[^a-zA-Z0-9._-]", "_", url.rstrip("/").split("/")[-1])[:32]
+        digest = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+        return f"{slug}-{digest}"
+
+    @staticmethod
+    def _legacy_sanitize_url(url: str) -> str:
+        """旧版截断式目录名，仅用于识别升级前已存在的缓存"""
         clean = url.replace("https://", "").replace("http://", "")
         clean = clean.replace("/", "_").replace("\\", "_")
         return clean[:100]
 
     @staticmethod
     def _get_cache_dir(github_url: str) -> Path:
-        """获取仓库的缓存目录"""
-        cache_name = RepoCacheManager._sanitize_url(github_url)
-        return CACHE_DIR / cache_name
+        """获取仓库的缓存目录（新命名优先，兼容旧命名的存量缓存）"""
+        new_dir = CACHE_DIR / RepoCacheManager._sanitize_url(github_url)
+        if new_dir.exists():
+            return new_dir
+        legacy = CACHE_DIR / RepoCacheManager._legacy_sanitize_url(github_url)
+        if legacy.exists():
+            return legacy
+        return new_dir
 
     @staticmethod
     def _get_meta_file(cache_dir: Path) -> Path:
@@ -748,14 +1325,32 @@ class RepoCacheManager:
         with open(last_cloned_file, "w", encoding="utf-8") as f:
             f.write(cache_dir_name)
 
+    @staticmethod
+    def _dir_size(root: Path) -> int:
+        """迭代 os.scandir 统计目录字节数
+
+        DirEntry 的 is_dir/is_file/stat 复用 scandir 带回的元数据，
+        每个条目一次系统调用，比 rglob + 两次 stat 少一半开销，
+        也不为每个文件分配 Path 对象。符号链接不跟随、不计入。
+        """
+        total = 0
+        stack = [str(root)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        return total
+
     @staticmethod
     def load_meta(cache_dir: Path) -> Optional[Dict]:
         """加载缓存元数据"""
         meta_file = RepoCacheManager._get_meta_file(cache_dir)
         if meta_file.exists():
             try:
-                with open(meta_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return _json_loads(meta_file.read_bytes())
             except Exception:
                 pass
         return None
@@ -765,8 +1360,117 @@ class RepoCacheManager:
         """保存缓存元数据"""
         meta_file = RepoCacheManager._get_meta_file(cache_dir)
         cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(meta_file, "w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=2, ensure_ascii=False)
+        meta_file.write_bytes(_json_dumps(meta))
+
+    # ---- ETag 条件请求缓存（url -> ETag 映射 + 按 url 哈希存储的响应体）----
+
+    _etag_map: Optional[Dict[str, str]] = None
+
+    @staticmethod
+    def _etag_index_file() -> Path:
+        return CACHE_DIR / ".etags.json"
+
+    @staticmethod
+    def _etag_body_file(url: str) -> Path:
+        return CACHE_DIR / ".etag_bodies" / hashlib.sha1(url.encode()).hexdigest()
+
+    @staticmethod
+    def get_etag_map() -> Dict[str, str]:
+        """进程内共享的 url -> ETag 映射（首次访问从磁盘加载）"""
+        if RepoCacheManager._etag_map is None:
+            try:
+                with open(RepoCacheManager._etag_index_file(), "r", encoding="utf-8") as f:
+                    RepoCacheManager._etag_map = json.load(f)
+            except Exception:
+                RepoCacheManager._etag_map = {}
+        return RepoCacheManager._etag_map
+
+    @staticmethod
+    def _save_etag_map() -> None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(RepoCacheManager._etag_index_file(), "w", encoding="utf-8") as f:
+                json.dump(RepoCacheManager.get_etag_map(), f)
+        except Exception:
+            pass
+
+    @staticmethod
+    def store_etag(url: str, etag: Optional[str], body: Optional[str]) -> None:
+        """记录响应的 ETag 和正文（无 ETag 时为空操作）"""
+        if not etag or body is None:
+            return
+        try:
+            body_file = RepoCacheManager._etag_body_file(url)
+            body_file.parent.mkdir(parents=True, exist_ok=True)
+            body_file.write_text(body, encoding="utf-8")
+        except Exception:
+            return
+        RepoCacheManager.get_etag_map()[url] = etag
+        RepoCacheManager._save_etag_map()
+
+    @staticmethod
+    def load_etag_body(url: str) -> Optional[str]:
+        """读取 304 命中时复用的缓存正文"""
+        try:
+            return RepoCacheManager._etag_body_file(url).read_text(encoding="utf-8")
+        except Exception:
+            return None
+
+    @staticmethod
+    def drop_etag(url: str) -> None:
+        """移除失效的 ETag 记录"""
+        if RepoCacheManager.get_etag_map().pop(url, None) is not None:
+            RepoCacheManager._save_etag_map()
+
+    @staticmethod
+    def _local_head_sha(cache_dir: Path) -> Optional[str]:
+        """读取缓存仓库的 HEAD sha（失败返回 None）"""
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(cache_dir), "rev-parse", "HEAD"],
+                capture_output=True, text=True, timeout=10
+            )
+            if result.returncode == 0:
+                return result.stdout.strip() or None
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _remote_head_sha(github_url: str, timeout: int = 15) -> Optional[str]:
+        """通过 git ls-remote 获取远程 HEAD sha（失败返回 None）"""
+        try:
+            result = subprocess.run(
+                ["git", "ls-remote", github_url, "HEAD"],
+                capture_output=True, text=True, timeout=timeout
+            )
+            if result.returncode == 0 and result.stdout:
+                return result.stdout.split()[0] or None
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def has_warm_cache(github_url: str, subpath: Optional[str] = None) -> bool:
+        """只读判断本地是否已有可覆盖请求的缓存
+
+        不更新 meta、不触发克隆，供调用方在走网络快路径前先确认
+        本地没有现成可用的仓库。稀疏缓存只在覆盖请求子路径时算命中。
+        """
+        cache_dir = RepoCacheManager._get_cache_dir(github_url)
+        if not cache_dir.exists():
+            return False
+        meta = RepoCacheManager.load_meta(cache_dir)
+        if not meta or meta.get("url") != github_url:
+            return False
+        cached_sparse = (meta.get("sparse_subpath") or "").strip("/")
+        if not cached_sparse:
+            return True
+        requested_sub = (subpath or "").strip("/")
+        return bool(requested_sub) and (
+            requested_sub == cached_sparse
+            or requested_sub.startswith(cached_sparse + "/")
+        )
 
     @staticmethod
     def get_or_clone(
@@ -775,7 +1479,8 @@ class RepoCacheManager:
         timeout: int = 300,
         user_input: Optional[str] = None,
         requested_skill: Optional[str] = None,
-        install_params: Optional[Dict] = None
+        install_params: Optional[Dict] = None,
+        subpath: Optional[str] = None
     ) -> Tuple[bool, Optional[Path], str]:
         """
         获取仓库（优先从缓存）
@@ -787,16 +1492,28 @@ class RepoCacheManager:
             user_input: 用户原始输入的 URL/路径
             requested_skill: 用户指定的 skill_name
             install_params: 安装时的其他参数
+            subpath: 可选，仅需要的仓库子目录（触发稀疏检出）
 
         Returns:
             (成功, 仓库路径, 消息)
         """
         cache_dir = RepoCacheManager._get_cache_dir(github_url)
+        requested_sub = (subpath or "").strip("/")
+
+        def _cache_covers(meta: Dict) -> bool:
+            """稀疏缓存只包含其 sparse_subpath 子树，覆盖不了的请求视为缓存未命中"""
+            cached_sparse = (meta.get("sparse_subpath") or "").strip("/")
+            if not cached_sparse:
+                return True
+            return bool(requested_sub) and (
+                requested_sub == cached_sparse
+                or requested_sub.startswith(cached_sparse + "/")
+            )
 
         # 1. 检查缓存是否存在
         if cache_dir.exists() and not force_refresh:
             meta = RepoCacheManager.load_meta(cache_dir)
-            if meta and meta.get("url") == github_url:
+            if meta and meta.get("url") == github_url and _cache_covers(meta):
                 # 更新 meta（用户可能用不同参数再次请求）
                 updated_meta = meta.copy()
                 # 始终更新 user_input（保留最新的完整 URL）
@@ -820,13 +1537,26 @@ class RepoCacheManager:
                 cached_time = meta.get("cached_at", "")
                 return True, cache_dir, f"使用缓存 (缓存于 {cached_time})"
 
+        # 1.5 强制刷新前先比对 HEAD sha：远程未变时复用缓存，
+        # 一次 ls-remote（几 KB）替代整仓重新克隆
+        if force_refresh and cache_dir.exists():
+            meta = RepoCacheManager.load_meta(cache_dir)
+            if meta and meta.get("url") == github_url and _cache_covers(meta):
+                local_sha = RepoCacheManager._local_head_sha(cache_dir)
+                if local_sha and local_sha == RepoCacheManager._remote_head_sha(github_url):
+                    meta["last_accessed"] = datetime.now().isoformat()
+                    meta["head_sha"] = local_sha
+                    RepoCacheManager.save_meta(cache_dir, meta)
+                    RepoCacheManager.write_last_cloned(cache_dir.name)
+                    return True, cache_dir, "缓存已是最新 (远程 HEAD 未变化)"
+
         # 2. 缓存不存在或强制刷新，执行克隆
         info(f"克隆仓库到缓存: {github_url}")
 
         # 如果旧缓存存在，先删除
         if cache_dir.exists():
             try:
-                shutil.rmtree(cache_dir, ignore_errors=False)
+                shutil.rmtree(cache_dir, onerror=_on_rm_error)
             except Exception as e:
                 error(f"无法删除缓存目录，请手动删除后重试: {cache_dir}")
                 error(f"错误信息: {e}")
@@ -835,7 +1565,7 @@ class RepoCacheManager:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
         # 执行克隆
-        clone_ok, _ = GitHubHandler.clone_repo(github_url, cache_dir)
+        clone_ok, _ = GitHubHandler.clone_repo(github_url, cache_dir, subpath=requested_sub or None)
 
         if not clone_ok:
             return False, None, "仓库不存在或路径错误，请确认:\n1. 仓库 URL 是否正确\n2. 是否为子技能（尝试使用 --skill 参数）\n3. 查看映射表: docs/skills-mapping.md"
@@ -857,7 +1587,9 @@ class RepoCacheManager:
             "user_input": final_user_input,
             "requested_skill": requested_skill or "",
             "install_params": install_params or {},
-            "last_accessed": datetime.now().isoformat()
+            "last_accessed": datetime.now().isoformat(),
+            "head_sha": RepoCacheManager._local_head_sha(cache_dir) or "",
+            "sparse_subpath": requested_sub if (cache_dir / ".git" / "info" / "sparse-checkout").exists() else ""
         }
         RepoCacheManager.save_meta(cache_dir, meta)
 
@@ -887,7 +1619,7 @@ class RepoCacheManager:
                 # 计算缓存大小
                 size_mb = 0
                 try:
-                    size = sum(f.stat().st_size for f in cache_dir.rglob('*') if f.is_file())
+                    size = RepoCacheManager._dir_size(cache_dir)
                     size_mb = round(size / (1024 * 1024), 2)
                 except Exception:
                     pass
@@ -942,7 +1674,7 @@ class RepoCacheManager:
 
             if should_delete:
                 try:
-                    shutil.rmtree(cache_dir, ignore_errors=False)
+                    shutil.rmtree(cache_dir, onerror=_on_rm_error)
                     cleared += 1
                 except Exception as e:
                     warn(f"删除缓存失败: {cache_dir.name} - {e}")
@@ -959,10 +1691,48 @@ class GitHubHandler:
     """处理 GitHub 仓库的克隆和提取"""
 
     @staticmethod
-    def clone_repo(github_url: str, target_dir: Path) -> Tuple[bool, Path]:
+    def _pick_fastest_proxy(proxies: list, repo_path: str, timeout: float = 3.0) -> Optional[str]:
+        """并发探测加速器可用性，返回最先响应 200 的加速器模板
+
+        逐个串行探测时，一个失效加速器就要等满超时才能尝试下一个。
+        这里用线程池并发发起 HEAD 请求，取最先成功者，其余自动放弃。
+
+        Returns:
+            可用的加速器模板，全部失败时返回 None
+        """
+        if not proxies:
+            return None
+
+        def _probe(proxy_template: str) -> Optional[str]:
+            proxy_url = proxy_template.replace("{repo}", repo_path)
+            try:
+                req = urllib.request.Request(proxy_url, method="HEAD")
+                with urllib.request.urlopen(req, timeout=timeout) as response:
+                    if response.status == 200:
+                        return proxy_template
+            except Exception:
+                pass
+            return None
+
+        with ThreadPoolExecutor(max_workers=len(proxies)) as executor:
+            futures = [executor.submit(_probe, p) for p in proxies]
+            try:
+                for future in as_completed(futures, timeout=timeout + 1):
+                    result = future.result()
+                    if result:
+                        return result
+            except FuturesTimeoutError:
+                pass
+        return None
+
+    @staticmethod
+    def clone_repo(github_url: str, target_dir: Path, subpath: Optional[str] = None) -> Tuple[bool, Path]:
         """
         克隆 GitHub 仓库（支持加速器）
 
+        Args:
+            subpath: 可选，仅需要仓库内的该子目录时走稀疏检出
+
         Returns:
             (成功, 克隆目录)
         """
@@ -978,7 +1748,7 @@ class GitHubHandler:
         if target_dir.exists():
             info(f"目标目录已存在，清理: {target_dir}")
             try:
-                shutil.rmtree(target_dir, ignore_errors=False)
+                shutil.rmtree(target_dir, onerror=_on_rm_error)
             except Exception as e:
                 warn(f"目录清理失败: {target_dir}")
                 warn(f"错误信息: {e}")
@@ -998,12 +1768,11 @@ class GitHubHandler:
         can_direct_connect = False
         try:
             probe_cmd = cmd + ["ls-remote", "--heads", github_url]
+            # 只关心退出码，输出直接丢弃，省去管道传输和解码
             probe_result = subprocess.run(
                 probe_cmd,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5,
                 env=env,
             )
@@ -1015,38 +1784,79 @@ class GitHubHandler:
 
         # 根据探测结果选择克隆策略
         if can_direct_connect:
+            # 只需要子目录时优先稀疏检出：--filter=blob:none 跳过无关 blob，
+            # monorepo 场景下网络流量和磁盘写入从整仓降到子目录量级；
+            # 任一步失败则清理残留并降级为普通克隆
+            if subpath:
+                try:
+                    sparse_clone_cmd = cmd + [
+                        "clone", "--quiet", "--depth", "1", "--single-branch",
+                        "--filter=blob:none", "--sparse",
+                        github_url, str(target_dir)
+                    ]
+                    result = subprocess.run(
+                        sparse_clone_cmd,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=300,
+                        env=env,
+                    )
+                    if result.returncode == 0:
+                        sparse_set_cmd = ["git", "-C", str(target_dir), "sparse-checkout", "set", subpath]
+                        result = subprocess.run(
+                            sparse_set_cmd,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            timeout=60,
+                            env=env,
+                        )
+                        if result.returncode == 0:
+                            success(f"克隆成功（稀疏检出 {subpath}）: {target_dir}")
+                            return True, target_dir
+                except Exception as e:
+                    warn(f"稀疏检出失败，降级为普通克隆: {e}")
+                if target_dir.exists():
+                    shutil.rmtree(target_dir, ignore_errors=True)
+
             # 直连可用，直接克隆
             try:
-                clone_cmd = cmd + ["clone", "--depth", "1", github_url, str(target_dir)]
+                # --quiet + DEVNULL：clone 的进度输出不经管道缓冲和解码，
+                # 仅保留 stderr 供失败时提示
+                clone_cmd = cmd + ["clone", "--quiet", "--depth", "1", "--single-branch", github_url, str(target_dir)]
                 result = subprocess.run(
                     clone_cmd,
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     timeout=300,
                     env=env,
                 )
                 if result.returncode == 0:
                     success(f"克隆成功（直连）: {target_dir}")
                     return True, target_dir
+                if result.stderr:
+                    warn(f"直连克隆失败: {result.stderr.decode('utf-8', errors='replace')[:200]}")
             except Exception as e:
                 warn(f"直连克隆失败: {e}")
 
         # 直连不可用或失败，尝试加速器
         proxies = get_git_proxies()
+        repo_path = github_url.replace("https://github.com/", "").replace("http://github.com/", "")
+
+        # 并发探测所有加速器，把最先响应的排到最前（失败时保持原顺序降级）
+        fastest = GitHubHandler._pick_fastest_proxy(proxies, repo_path)
+        if fastest:
+            info(f"加速器探测成功，优先使用: {fastest}")
+            proxies = [fastest] + [p for p in proxies if p != fastest]
+
         for proxy_template in proxies:
-            repo_path = github_url.replace("https://github.com/", "").replace("http://github.com/", "")
             proxy_url = proxy_template.replace("{repo}", repo_path)
 
             try:
-                clone_cmd = cmd + ["clone", "--depth", "1", proxy_url, str(target_dir)]
+                clone_cmd = cmd + ["clone", "--quiet", "--depth", "1", "--single-branch", proxy_url, str(target_dir)]
                 result = subprocess.run(
                     clone_cmd,
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=20,
                     env=env,
                 )
@@ -1095,6 +1905,8 @@ class GitHubHandler:
                                 "relative_path": new_rel_path
                             })
                             info(f"发现深层技能: {new_rel_path}")
+                            # 短路：技能目录内部不会再嵌套技能，无需继续下探
+                            continue
 
                         _scan_recursive(item, current_depth + 1, new_rel_path)
             except (PermissionError, OSError):
@@ -1117,6 +1929,30 @@ class GitHubHandler:
         skill_dirs = []
         exclude_dirs = {"examples", "templates", "test", "tests", "docs", "reference"}
 
+        # 单次 scandir 缓存：同一目录的多轮检测复用同一份列表，
+        # 避免 iterdir()/glob() 反复读目录和逐项 stat
+        _dir_cache: Dict[Path, List[Tuple[str, Path, bool]]] = {}
+
+        def _scan_subdirs(directory: Path) -> List[Tuple[str, Path, bool]]:
+            """列出子目录 (名称, 路径, 是否含 SKILL.md)，结果按目录缓存"""
+            cached = _dir_cache.get(directory)
+            if cached is not None:
+                return cached
+            entries = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            entries.append((
+                                entry.name,
+                                Path(entry.path),
+                                os.path.exists(os.path.join(entry.path, "SKILL.md")),
+                            ))
+            except OSError:
+                pass
+            _dir_cache[directory] = entries
+            return entries
+
         # 检测 .skill 包文件
         skill_packages = list(repo_dir.glob("*.skill"))
         if skill_packages:
@@ -1144,9 +1980,10 @@ class GitHubHandler:
         claude_code_skills = []
         agent_skills_dir = repo_dir / ".agent" / "skills"
         if agent_skills_dir.exists():
-            for item in agent_skills_dir.glob("*/SKILL.md"):
-                if item.parent.name not in exclude_dirs:
-                    claude_code_skills.append(item.parent)
+            claude_code_skills = [
+                path for name, path, has_md in _scan_subdirs(agent_skills_dir)
+                if has_md and name not in exclude_dirs
+            ]
 
         if claude_code_skills:
             return claude_code_skills
@@ -1157,8 +1994,8 @@ class GitHubHandler:
                 if location == repo_dir:
                     if (location / "SKILL.md").exists():
                         sub_skill_dirs = [
-                            item.parent for item in repo_dir.glob("*/SKILL.md")
-                            if item.parent.name not in exclude_dirs
+                            path for name, path, has_md in _scan_subdirs(repo_dir)
+                            if has_md and name not in exclude_dirs
                         ]
                         MULTI_SKILL_THRESHOLD = 3
                         if len(sub_skill_dirs) >= MULTI_SKILL_THRESHOLD:
@@ -1170,22 +2007,20 @@ class GitHubHandler:
                     else:
                         skills_dir = repo_dir / "skills"
                         if skills_dir.exists() and skills_dir.is_dir():
-                            sub_skill_count = 0
-                            sub_skill_candidates = []
-                            for item in skills_dir.iterdir():
-                                if item.is_dir() and (item / "SKILL.md").exists():
-                                    sub_skill_candidates.append(item)
-                                    sub_skill_count += 1
+                            sub_skill_candidates = [
+                                path for name, path, has_md in _scan_subdirs(skills_dir)
+                                if has_md
+                            ]
+                            sub_skill_count = len(sub_skill_candidates)
                             if sub_skill_count >= 1:
                                 info(f"检测到 monorepo: skills/ 目录包含 {sub_skill_count} 个技能")
                                 skill_dirs.extend(sub_skill_candidates)
                                 continue
 
-                        root_sub_skills = []
-                        for item in repo_dir.iterdir():
-                            if item.is_dir() and not item.name.startswith(".") and item.name not in exclude_dirs:
-                                if (item / "SKILL.md").exists():
-                                    root_sub_skills.append(item)
+                        root_sub_skills = [
+                            path for name, path, has_md in _scan_subdirs(repo_dir)
+                            if has_md and not name.startswith(".") and name not in exclude_dirs
+                        ]
                         if len(root_sub_skills) >= 2:
                             info(f"检测到 monorepo: 根目录包含 {len(root_sub_skills)} 个子技能")
                             skill_dirs.extend(root_sub_skills)
@@ -1194,13 +2029,12 @@ class GitHubHandler:
                 if location.name == "skills" and location.parent == repo_dir:
                     continue
 
-                sub_skill_count = 0
-                sub_skill_candidates = []
-                for item in location.iterdir():
-                    if item.is_dir() and item.name not in exclude_dirs:
-                        if (item / "SKILL.md").exists():
-                            sub_skill_count += 1
-                            sub_skill_candidates.append(item)
+                location_entries = _scan_subdirs(location)
+                sub_skill_candidates = [
+                    path for name, path, has_md in location_entries
+                    if has_md and name not in exclude_dirs
+                ]
+                sub_skill_count = len(sub_skill_candidates)
 
                 MULTI_SKILL_THRESHOLD = 3
                 if sub_skill_count >= MULTI_SKILL_THRESHOLD:
@@ -1208,11 +2042,11 @@ class GitHubHandler:
                     skill_dirs.extend(sub_skill_candidates)
                     continue
 
-                for item in location.iterdir():
-                    if item.is_dir() and (not item.name.startswith(".") or item.name == ".claude"):
-                        if item.name in exclude_dirs:
+                for name, item, has_md in location_entries:
+                    if not name.startswith(".") or name == ".claude":
+                        if name in exclude_dirs:
                             continue
-                        has_skill = (item / "SKILL.md").exists() or list(item.glob("*.md"))
+                        has_skill = has_md or list(item.glob("*.md"))
                         if has_skill:
                             skill_dirs.append(item)
 
@@ -1226,11 +2060,10 @@ class GitHubHandler:
 
         # 回退机制2：单层子目录
         if not skill_dirs:
-            fallback_skills = []
-            for item in repo_dir.iterdir():
-                if item.is_dir() and not item.name.startswith(".") and item.name not in exclude_dirs:
-                    if (item / "SKILL.md").exists():
-                        fallback_skills.append(item)
+            fallback_skills = [
+                path for name, path, has_md in _scan_subdirs(repo_dir)
+                if has_md and not name.startswith(".") and name not in exclude_dirs
+            ]
             if fallback_skills:
                 info(f"回退检测: 发现 {len(fallback_skills)} 个子技能")
                 skill_dirs.extend(fallback_skills)
@@ -1271,8 +2104,13 @@ def _extract_repo_from_url(github_url: str) -> Optional[str]:
         return f"{path_parts[0]}/{path_parts[1]}"
     return None
 
-def _dual_path_skill_check(github_url: str) -> Tuple[bool, str, List[str]]:
-    """统一的技能判定"""
+def _dual_path_skill_check(github_url: str, analyzer: Optional[RemoteSkillAnalyzer] = None) -> Tuple[bool, str, List[str]]:
+    """统一的技能判定
+
+    Args:
+        github_url: GitHub 仓库 URL
+        analyzer: 可复用的分析器实例（保留已探测的加速器和响应缓存）
+    """
     parsed = urlparse(github_url)
     if "github.com" not in parsed.netloc:
         return True, "非 GitHub URL，跳过预检", ["fallback"]
@@ -1281,7 +2119,8 @@ def _dual_path_skill_check(github_url: str) -> Tuple[bool, str, List[str]]:
     if not repo:
         return True, "无法解析仓库，跳过预检", ["fallback"]
 
-    analyzer = RemoteSkillAnalyzer(repo)
+    if analyzer is None:
+        analyzer = RemoteSkillAnalyzer(repo)
     is_skill, reason = analyzer.check_is_skill_repo()
 
     if is_skill is True:
@@ -1291,6 +2130,56 @@ def _dual_path_skill_check(github_url: str) -> Tuple[bool, str, List[str]]:
     else:
         return True, reason, ["fallback"]
 
+def _fetch_skills_via_rest(
+    analyzer: RemoteSkillAnalyzer,
+    skill_name: str,
+    temp_dir: Path
+) -> List[Path]:
+    """令牌快路径：通过 REST API 直接下载指定技能子树，跳过 git clone
+
+    仅在配置了 GitHub token 时调用。定位到技能目录后逐文件下载，
+    任何失败都返回空列表，由调用方降级到 clone 流程。
+    """
+    # 确定分支
+    for branch in ("main", "master"):
+        analyzer.branch = branch
+        if analyzer.exists("SKILL.md") or analyzer.exists("README.md"):
+            break
+
+    # 按常见布局定位技能目录
+    candidates = [f"skills/{skill_name}", f"plugins/{skill_name}", skill_name]
+    normalized = skill_name.lower().replace('_', '-')
+    if normalized != skill_name:
+        candidates.extend([f"skills/{normalized}", f"plugins/{normalized}", normalized])
+
+    for folder in candidates:
+        if not analyzer.exists(f"{folder}/SKILL.md"):
+            continue
+
+        dest = temp_dir / "rest" / folder.rsplit("/", 1)[-1]
+        if dest.exists():
+            shutil.rmtree(dest, ignore_errors=True)
+
+        if analyzer.download_subtree(folder, dest):
+            # 写入 meta，安装阶段据此解析 author/repo
+            author, _, repo_name = analyzer.repo.partition("/")
+            RepoCacheManager.save_meta(dest.parent, {
+                "url": analyzer.github_url,
+                "author": author,
+                "repo": repo_name,
+                "branch": analyzer.branch,
+                "cached_at": datetime.now().isoformat(),
+            })
+            info(f"REST 快路径获取技能: {folder}")
+            return [dest]
+
+        # 下载不完整，清理后降级到 clone
+        shutil.rmtree(dest, ignore_errors=True)
+        break
+
+    return []
+
+
 def _process_github_source(
     github_url: str,
     skill_name: Optional[str] = None,
@@ -1325,8 +2214,9 @@ def _process_github_source(
     effective_input = original_url or user_input or github_url
 
     # 修复: 如果 skill_name 为空，尝试从原始 URL 的 subpath 中提取
+    _, requested_subpath = FormatDetector.parse_github_subpath(effective_input)
     if not skill_name:
-        _, subpath = FormatDetector.parse_github_subpath(effective_input)
+        subpath = requested_subpath
         if subpath:
             # 提取最后一部分作为 skill_name
             # 例如: skills/baoyu-article-illustrator -> baoyu-article-illustrator
@@ -1335,21 +2225,37 @@ def _process_github_source(
                 skill_name = extracted_name
                 info(f"从 URL 提取子技能名: {skill_name}")
 
+    # 预检共用一个分析器实例：加速器探测结果和文件响应缓存只建立一次
+    repo = _extract_repo_from_url(github_url)
+    analyzer = RemoteSkillAnalyzer(repo) if repo else None
+
     # 1. 技能仓库预检
-    should_proceed, reason, sources = _dual_path_skill_check(github_url)
+    should_proceed, reason, sources = _dual_path_skill_check(github_url, analyzer)
     if not should_proceed:
         return [], reason
 
     # 2. 子技能预检（仅当指定了子技能名）
-    if skill_name:
-        repo = _extract_repo_from_url(github_url)
-        if repo:
-            try:
-                analyzer = RemoteSkillAnalyzer(repo)
-                if not analyzer._verify_single_skill(skill_name):
-                    warn(f"子技能预检失败: {skill_name}")
-            except Exception:
-                pass
+    if skill_name and analyzer is not None:
+        try:
+            if not analyzer._verify_single_skill(skill_name):
+                warn(f"子技能预检失败: {skill_name}")
+        except Exception:
+            pass
+
+    # 2.5 令牌快路径：有 token 且指定了子技能时，直接 REST 拉取子树，
+    # 省去 git 子进程和整仓克隆的磁盘写入；失败时自动降级到 clone。
+    # 本地已有可用缓存时优先用缓存，缓存未命中或强制刷新才走网络
+    cache_is_warm = (
+        use_cache and not force_refresh
+        and RepoCacheManager.has_warm_cache(github_url, subpath=requested_subpath)
+    )
+    if skill_name and analyzer is not None and analyzer.token and not cache_is_warm:
+        try:
+            rest_dirs = _fetch_skills_via_rest(analyzer, skill_name, temp_dir)
+        except Exception:
+            rest_dirs = []
+        if rest_dirs:
+            return rest_dirs, f"成功获取 {len(rest_dirs)} 个技能（REST 快路径）"
 
     # 3. 缓存机制
     if use_cache:
@@ -1358,7 +2264,8 @@ def _process_github_source(
             force_refresh=force_refresh,
             user_input=effective_input,  # 使用原始完整 URL
             requested_skill=skill_name,
-            install_params=install_params
+            install_params=install_params,
+            subpath=requested_subpath
         )
         if cache_ok and cache_dir:
             info(cache_msg)  # 输出缓存状态消息
@@ -1366,7 +2273,7 @@ def _process_github_source(
         else:
             return [], cache_msg
     else:
-        clone_ok, repo_dir = GitHubHandler.clone_repo(github_url, temp_dir / "repo")
+        clone_ok, repo_dir = GitHubHandler.clone_repo(github_url, temp_dir / "repo", subpath=requested_subpath)
         if not clone_ok:
             return [], "仓库不存在或路径错误\n提示: 查看 docs/skills-mapping.md 确认正确的仓库路径"
         scan_dir = repo_dir
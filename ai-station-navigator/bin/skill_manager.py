@@ -24,7 +24,6 @@ v1.0 - Feature Complete:
     - 完整的验证流程
 """
 
-import argparse
 import sys
 import os
 
@@ -39,20 +38,22 @@ if sys.platform == 'win32':
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 
-import concurrent.futures
-import glob
+import functools
 import json
 import re
-import shutil
-import subprocess
 import time
-import zipfile
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urlparse
-import tempfile
-import yaml
+
+# 重量级模块按需导入：argparse/yaml/zipfile/subprocess/tinydb 只在
+# 用到它们的子命令路径里 import，record/list/formats 等高频命令不付启动成本
+
+# orjson（C 实现）解析 JSON 比标准库快数倍，绿色包未预置时回退标准库
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # 添加项目 lib 目录到 sys.path（绿色包预置依赖）
 _lib_dir = Path(__file__).parent.parent / "lib"
@@ -64,13 +65,30 @@ _bin_dir = Path(__file__).parent
 if str(_bin_dir) not in sys.path:
     sys.path.insert(0, str(_bin_dir))
 
-# TinyDB for database operations
-try:
-    from tinydb import TinyDB, Query
-    from tinydb.storages import JSONStorage
-    TINYDB_AVAILABLE = True
-except ImportError:
-    TINYDB_AVAILABLE = False
+# TinyDB 惰性加载缓存：(TinyDB, Query, UTF8JSONStorage)，不可用时为 (None, None, None)
+_tinydb_cache: Optional[Tuple] = None
+
+
+def _get_tinydb() -> Tuple:
+    """惰性导入 tinydb（失败时返回 (None, None, None)）"""
+    global _tinydb_cache
+    if _tinydb_cache is None:
+        try:
+            from tinydb import TinyDB, Query
+            from tinydb.storages import JSONStorage
+
+            class UTF8JSONStorage(JSONStorage):
+                """自定义 JSONStorage，强制使用 UTF-8 编码（修复 Windows GBK 问题）"""
+
+                def __init__(self, path, **kwargs):
+                    # 强制使用 UTF-8 编码
+                    kwargs['encoding'] = 'utf-8'
+                    super().__init__(path, **kwargs)
+
+            _tinydb_cache = (TinyDB, Query, UTF8JSONStorage)
+        except ImportError:
+            _tinydb_cache = (None, None, None)
+    return _tinydb_cache
 
 # =============================================================================
 # 解耦说明：不再直接导入 clone_manager 和 security_scanner
@@ -84,24 +102,43 @@ except ImportError:
 BASE_DIR = Path(__file__).parent.parent
 CLAUDE_SKILLS_DIR = BASE_DIR / ".claude" / "skills"
 TEMP_DIR = BASE_DIR / "mybox" / "temp"
+
+# GitHub URL 识别前缀（validate_github_url 也只接受这两种形态）
+_GITHUB_URL_PREFIXES = ("https://github.com/", "http://github.com/")
 SKILLS_DB_FILE = BASE_DIR / ".claude" / "skills" / "skills.db"
 CACHE_DIR = BASE_DIR / "mybox" / "cache" / "repos"
 
 # 官方技能标准
 REQUIRED_FIELDS = ["name", "description"]
 SKILL_NAME_PATTERN = re.compile(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$")
+# 预编译的高频模式：避免每次调用走 re 模块的缓存查找 + 参数解析
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_NORMALIZE_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+# kebab-case 校验的纯字符串实现：translate 删除合法字符后有剩余即非法，
+# monorepo 扫描对每个子目录名都要跑这个判断，省掉正则虚拟机开销
+_KEBAB_STRIP_TABLE = str.maketrans("", "", "abcdefghijklmnopqrstuvwxyz0123456789-")
+
+
+def _is_kebab_name(name: str) -> bool:
+    """等价于 SKILL_NAME_PATTERN.match：小写字母/数字/连字符，首尾非连字符"""
+    return (
+        bool(name)
+        and name[0] != "-"
+        and name[-1] != "-"
+        and not name.translate(_KEBAB_STRIP_TABLE)
+    )
 MAX_NAME_LENGTH = 128
 MAX_DESC_LENGTH = 1024
 
 # 处理阈值常量
 SINGLE_SKILL_THRESHOLD = 1          # 单技能判断阈值
-FRONTMATTER_PREVIEW_LINES = 10      # frontmatter 预览行数
 LIST_DESC_PREVIEW_CHARS = 500       # 列表命令描述预览字符数
 
 # 技能默认值常量
 DEFAULT_SKILL_DESC = "无描述"       # 默认技能描述
 DEFAULT_SKILL_CATEGORY = "utilities"  # 默认分类
-DEFAULT_SKILL_TAGS = ["skill"]      # 默认标签
+DEFAULT_SKILL_TAGS = ("skill",)     # 默认标签（只读，入库时转 list）
 
 # =============================================================================
 # 格式注册表 (Format Registry)
@@ -143,11 +180,58 @@ SUPPORTED_FORMATS = {
     # },
 }
 
+# 模块加载时预处理格式注册表：去掉标记尾部斜杠得到目录项名，并构建
+# 标记 -> 格式 的反向索引。detect_skill_format 据此用单次 listdir +
+# 集合运算代替逐标记 exists() 探测
+for _fmt_data in SUPPORTED_FORMATS.values():
+    _fmt_data["_marker_names"] = tuple(m.rstrip("/") for m in _fmt_data["markers"])
+
+_ALL_MARKERS = {
+    marker_name: fmt_id
+    for fmt_id, data in SUPPORTED_FORMATS.items()
+    for marker_name in data["_marker_names"]
+}
+
+
+# =============================================================================
+# 文件存在性缓存
+# =============================================================================
+# 安装流程里同一批路径会被验证器反复探测（monorepo 逐子目录检查 SKILL.md
+# 等），每次 exists() 都是一个系统调用。只读验证阶段走缓存版本；
+# 任何写盘操作之后调用 invalidate_fs_cache() 防止读到过期结果
+
+@functools.lru_cache(maxsize=4096)
+def _cached_exists(path_str: str) -> bool:
+    """os.path.exists 的进程内缓存版（仅用于只读验证路径）"""
+    return os.path.exists(path_str)
+
+
+def invalidate_fs_cache() -> None:
+    """清空文件存在性缓存（转换/安装写盘后调用）"""
+    _cached_exists.cache_clear()
+
 
 # =============================================================================
 # 临时目录清理工具
 # =============================================================================
 
+def _force_writable(path) -> None:
+    """
+    递归放开目录树的写权限（Windows 下 .git 对象文件默认只读，
+    rmtree 会失败）。单次 scandir 遍历，已可写的文件跳过 chmod
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    os.chmod(entry.path, 0o755)
+                    _force_writable(entry.path)
+                elif not entry.stat(follow_symlinks=False).st_mode & 0o200:
+                    os.chmod(entry.path, 0o644)
+            except OSError:
+                pass
+
+
 def cleanup_old_install_dirs(max_age_hours: int = 24) -> int:
     """
     清理超过指定时间的 installer_* 临时目录
@@ -161,28 +245,51 @@ def cleanup_old_install_dirs(max_age_hours: int = 24) -> int:
     if not TEMP_DIR.exists():
         return 0
 
-    cleaned_count = 0
     current_time = time.time()
     max_age_seconds = max_age_hours * 3600
 
-    # 查找所有 installer_* 目录
-    installer_dirs = list(TEMP_DIR.glob("installer_*"))
+    # 哨兵文件记录上次清理时间：一小时内刚清理过就不再扫描
+    # （高频 install 场景下扫描几乎总是空手而归），一次 stat 换整目录扫描
+    sentinel = TEMP_DIR / ".last_cleanup"
+    try:
+        if current_time - sentinel.stat().st_mtime < 3600:
+            return 0
+    except OSError:
+        pass
 
-    for install_dir in installer_dirs:
-        if not install_dir.is_dir():
-            continue
+    # 单次 scandir 找出过期目录（DirEntry.stat() 复用目录项缓存，免逐个 stat）
+    stale_dirs = []
+    try:
+        with os.scandir(TEMP_DIR) as it:
+            for entry in it:
+                try:
+                    if (entry.name.startswith("installer_")
+                            and entry.is_dir()
+                            and current_time - entry.stat().st_mtime > max_age_seconds):
+                        stale_dirs.append(entry.path)
+                except Exception:
+                    pass  # P0 fix: 日志函数尚未定义，静默跳过
+    except OSError:
+        return 0
 
-        try:
-            # 检查目录年龄
-            dir_age = current_time - install_dir.stat().st_mtime
-            if dir_age > max_age_seconds:
-                shutil.rmtree(install_dir, ignore_errors=True)
-                cleaned_count += 1
-                # info(f"清理旧临时目录: {install_dir.name}")  # P0 fix: info() 尚未定义 (L238)
-        except Exception:
-            pass  # P0 fix: 日志函数尚未定义，静默跳过
+    try:
+        sentinel.touch()
+    except OSError:
+        pass
+
+    if not stale_dirs:
+        return 0
 
-    return cleaned_count
+    # rmtree 为 I/O 密集操作，多目录并行删除
+    import shutil
+    if len(stale_dirs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            list(ex.map(lambda p: shutil.rmtree(p, ignore_errors=True), stale_dirs))
+    else:
+        shutil.rmtree(stale_dirs[0], ignore_errors=True)
+
+    return len(stale_dirs)
 
 
 # =============================================================================
@@ -191,6 +298,7 @@ def cleanup_old_install_dirs(max_age_hours: int = 24) -> int:
 
 def log(level: str, message: str, emoji: str = ""):
     """统一日志输出"""
+    from datetime import datetime
     timestamp = datetime.now().strftime("%H:%M:%S")
     print(f"[{timestamp}] {emoji} [{level}] {message}")
 
@@ -217,6 +325,143 @@ def header(msg: str):
     print(f"{'='*60}\n")
 
 
+# =============================================================================
+# SKILL.md 读缓存
+# =============================================================================
+# detect_skill_format 探测过的文件，fix_frontmatter 往往马上整读一遍。
+# 按 (mtime_ns, size) 缓存全文让两步共享一次磁盘读取；文件被改写后
+# mtime 变化自动失效
+
+_skill_md_cache: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _read_skill_md(skill_md: Path) -> Optional[str]:
+    """读取 SKILL.md 全文（带 mtime/size 校验的进程内缓存），不存在返回 None"""
+    key = str(skill_md)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _skill_md_cache.pop(key, None)
+        return None
+
+    cached = _skill_md_cache.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    try:
+        content = skill_md.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    _skill_md_cache[key] = (st.st_mtime_ns, st.st_size, content)
+    return content
+
+
+_FRONTMATTER_SCAN_BYTES = 8192
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_frontmatter(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """按文件身份缓存的 frontmatter 解析结果（mtime/size 变化自动失效）"""
+    # frontmatter 约定在文件开头：长文档只读头部窗口，免整读整解码
+    if size > _FRONTMATTER_SCAN_BYTES:
+        try:
+            with open(path_str, "rb") as f:
+                head = f.read(_FRONTMATTER_SCAN_BYTES)
+        except OSError:
+            return {}
+        if not head.startswith(b"---"):
+            return {}
+        end = head.find(b"\n---", 4)
+        if end > 0:
+            # 闭合符是 ASCII，按它截断再解码不会切断多字节字符
+            return SkillNormalizer.extract_frontmatter(
+                head[:end + 4].decode("utf-8", "ignore")
+            )
+        # 窗口内未闭合（罕见）：回退整文件读取
+
+    content = _read_skill_md(Path(path_str))
+    if content is None:
+        return {}
+    return SkillNormalizer.extract_frontmatter(content)
+
+
+_today_cache: Tuple[float, str] = (0.0, "")
+
+
+def _today_str() -> str:
+    """当天日期字符串（60 秒内复用，批量安装免逐技能 strftime）"""
+    global _today_cache
+    now = time.time()
+    ts, value = _today_cache
+    if not value or now - ts >= 60.0:
+        from datetime import datetime
+        value = datetime.now().strftime("%Y-%m-%d")
+        _today_cache = (now, value)
+    return value
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_skill_id(folder_name: str) -> str:
+    """folder_name -> 数据库 id（小写、下划线转连字符），纯函数带缓存"""
+    return folder_name.lower().replace('_', '-')
+
+
+def _skill_frontmatter(skill_md: Path) -> Optional[Dict[str, Any]]:
+    """读取并解析 SKILL.md 的 frontmatter（文件不存在返回 None）
+
+    返回的 dict 在缓存内共享，调用方只读使用，需要修改时应自行拷贝
+    （fix_frontmatter 等改写路径仍直接调用 extract_frontmatter）。
+    """
+    try:
+        st = os.stat(str(skill_md))
+    except OSError:
+        return None
+    return _cached_frontmatter(str(skill_md), st.st_mtime_ns, st.st_size)
+
+
+_trash_swept = False
+
+
+def _discard_dir(path: str) -> None:
+    """把目录挪进 .claude/skills/.trash 后台删除
+
+    rmtree 在大目录（尤其 Windows）上可达秒级，回滚/覆盖热路径只付
+    一次 rename 的代价，字节回收交给后台线程；首次调用顺带清理上次
+    进程残留的回收站内容。挪动失败（跨设备等）时退回同步删除。
+    """
+    global _trash_swept
+    import shutil
+    trash_root = os.path.join(str(CLAUDE_SKILLS_DIR), ".trash")
+    try:
+        os.makedirs(trash_root, exist_ok=True)
+        import uuid
+        dest = os.path.join(trash_root, f"{os.path.basename(path)}.{uuid.uuid4().hex}")
+        os.replace(path, dest)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    import threading
+    if not _trash_swept:
+        _trash_swept = True
+        threading.Thread(target=_purge_trash, args=(trash_root,), daemon=True).start()
+    else:
+        threading.Thread(
+            target=shutil.rmtree, args=(dest,), kwargs={"ignore_errors": True}, daemon=True
+        ).start()
+
+
+def _purge_trash(trash_root: str) -> None:
+    """清空回收站当前内容（供后台线程调用）"""
+    import shutil
+    try:
+        entries = [e.path for e in os.scandir(trash_root)]
+    except OSError:
+        return
+    for entry in entries:
+        shutil.rmtree(entry, ignore_errors=True)
+
+
 # =============================================================================
 # 格式检测器 (独立实现，解耦于 clone_manager)
 # =============================================================================
@@ -224,6 +469,12 @@ def header(msg: str):
 class FormatDetector:
     """检测技能输入源的格式类型"""
 
+    # 预编译：每次校验省去 re 模块缓存查找和模式重解析
+    _GITHUB_URL_RE = re.compile(
+        r'^https?://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+'
+        r'(?:/tree/[^/\s]+(?:/[\w\-./]+)?)?$'
+    )
+
     @staticmethod
     def validate_github_url(url: str) -> Tuple[bool, Optional[str]]:
         """
@@ -235,10 +486,8 @@ class FormatDetector:
         Returns:
             (是否有效, 错误信息)
         """
-        import re
         # 基础格式检查
-        github_pattern = r'^https?://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+(?:/tree/[^/\s]+(?:/[\w\-./]+)?)?$'
-        if not re.match(github_pattern, url):
+        if not FormatDetector._GITHUB_URL_RE.match(url):
             return False, f"无效的 GitHub URL 格式: {url}"
 
         # 检查危险的 git 配置注入模式
@@ -266,15 +515,11 @@ class FormatDetector:
         Returns:
             (类型, 路径/URL, 子路径)
         """
-        from urllib.parse import urlparse
-
         info(f"检测输入源: {input_source}")
 
-        # 1. 检查是否是 GitHub URL
-        if input_source.startswith(("http://", "https://")):
-            parsed = urlparse(input_source)
-            if "github.com" in parsed.netloc:
-                return "github", input_source, None
+        # 1. 检查是否是 GitHub URL（前缀比较即可，省去 urlparse）
+        if input_source.startswith(_GITHUB_URL_PREFIXES):
+            return "github", input_source, None
 
         # 1.5 检查是否是 GitHub 简写 (user/repo)
         if "/" in input_source and not input_source.startswith((".", "/", "\\")):
@@ -312,35 +557,37 @@ class FormatDetector:
         """
         detected_markers = []
 
-        # 检查官方格式
-        skill_md = skill_dir / "SKILL.md"
-        if skill_md.exists():
-            try:
-                with open(skill_md, "r", encoding="utf-8", errors="ignore") as f:
-                    first_lines = "".join([f.readline() for _ in range(FRONTMATTER_PREVIEW_LINES)])
-                    if "---" in first_lines and "name:" in first_lines:
-                        return "official", ["SKILL.md"]
-            except (OSError, IOError) as e:
-                # P1 fix: 文件读取失败时静默跳过，继续检测其他格式
-                pass
+        # 检查官方格式（读缓存共享给随后的 fix_frontmatter，只检查头部）
+        content = _read_skill_md(skill_dir / "SKILL.md")
+        if content is not None:
+            head = content[:2048]
+            if "---" in head and "name:" in head:
+                return "official", ["SKILL.md"]
 
-        # 检查第三方格式标记
-        for format_type, format_data in SUPPORTED_FORMATS.items():
-            if format_type == "official":
-                continue
-            markers = format_data["markers"]
-            found = []
-            for marker in markers:
-                marker_path = skill_dir / marker
-                if marker_path.exists():
-                    found.append(marker)
-            if found:
+        # 检查第三方格式标记：单次 listdir 取目录项集合，和反向索引做交集，
+        # 有命中时再按注册顺序定位具体格式
+        try:
+            entry_names = set(os.listdir(skill_dir))
+        except OSError:
+            entry_names = set()
+
+        hits = entry_names & _ALL_MARKERS.keys()
+        if hits:
+            matched_formats = {_ALL_MARKERS[name] for name in hits}
+            for format_type, format_data in SUPPORTED_FORMATS.items():
+                if format_type not in matched_formats:
+                    continue
+                found = [
+                    marker
+                    for marker, marker_name in zip(format_data["markers"], format_data["_marker_names"])
+                    if marker_name in hits
+                ]
                 return format_type, found
 
         # 检查是否有 markdown 文件（可能是旧格式）
-        md_files = list(skill_dir.glob("*.md"))
+        md_files = [name for name in sorted(entry_names) if name.endswith(".md")]
         if md_files:
-            return "unknown-md", [f.name for f in md_files]
+            return "unknown-md", md_files
 
         return "unknown", []
 
@@ -352,57 +599,68 @@ class FormatDetector:
 class ProjectValidator:
     """验证项目是否为技能仓库，而非工具/应用程序"""
 
-    # 技能仓库的正面指示（根目录）- 优先检查
-    SKILL_REPO_INDICATORS = [
-        ("SKILL.md", "根目录有 SKILL.md 文件"),
-        ("_has_skills_dir", "skills/ 目录包含多个技能"),  # 特殊标记
-        (".claude/skills", "Anthropic 官方技能仓库结构"),
-        # .skill 包文件（可能有多个，用 glob 检查）
-    ]
+    # 技能仓库的正面指示（根目录）- 优先检查：
+    # SKILL.md / skills/ 多技能目录 / .claude/skills 官方结构，
+    # 见 is_skill_repo_root 第 1 步（逐项展开，复用目录快照）
 
     # 技能包仓库指示（包含 .skill 文件）
-    SKILL_PACKAGE_EXTENSIONS = [".skill"]
+    SKILL_PACKAGE_EXTENSIONS = (".skill",)
 
     # 工具项目的指示文件（根目录）- 精简到最常见的
-    TOOL_PROJECT_FILES = [
+    TOOL_PROJECT_FILES = (
         "setup.py",        # Python 包配置
         "Cargo.toml",      # Rust 项目
         "go.mod",          # Go 项目
-    ]
+    )
 
     # 需要进一步检查的文件（可能是技能或工具）
-    AMBIGUOUS_PROJECT_FILES = [
+    AMBIGUOUS_PROJECT_FILES = (
         "pyproject.toml",  # 可能是技能打包，也可能是工具
         "package.json",    # 可能是技能，也可能是 Node.js 项目
-    ]
+    )
 
     # 工具组件目录名（不是技能）- 精简到最常见的
-    TOOL_COMPONENT_NAMES = {
+    TOOL_COMPONENT_NAMES = frozenset({
         "api", "src", "lib", "core", "utils",
         "scripts", "tools", "bin", "build", "target",
         "tests", "docs", "config",
         ".git", ".github",
-    }
+    })
 
     # 非技能项目的关键词（在 README 中检测）- 精简到最常见的
-    NON_SKILL_KEYWORDS = [
+    NON_SKILL_KEYWORDS = (
         "skill generator",
         "generates skills",
         "creates skills",
         "install via pip",
         "command-line interface",
         "cli tool",
-    ]
+    )
 
     # 技能项目的正面指示词（README）
-    SKILL_INDICATORS = [
+    SKILL_INDICATORS = (
         "claude skill",
         "claude.ai skill",
         "claude code skill",
         "this skill helps",
         "use this skill to",
         "when to use this skill",
-    ]
+    )
+
+    # 指示词编译成单一交替正则：对 README 一次线性扫描代替逐词 in 搜索；
+    # IGNORECASE 使扫描直接作用于原文，省掉整篇 lower() 的拷贝
+    _SKILL_INDICATOR_RE = re.compile(
+        "|".join(re.escape(k) for k in SKILL_INDICATORS), re.IGNORECASE
+    )
+    _NON_SKILL_RE = re.compile(
+        "|".join(re.escape(k) for k in NON_SKILL_KEYWORDS), re.IGNORECASE
+    )
+
+    # README 关键词扫描只读开头部分（指示词几乎总在首屏）
+    README_SCAN_BYTES = 65536
+
+    # pyproject.toml 工具项目标志：字节级合并扫描，免整文件解码
+    _TOOL_CONFIG_RE = re.compile(rb"tool\.scripts|command-line", re.IGNORECASE)
 
     @staticmethod
     def is_skill_repo_root(repo_dir: Path) -> Tuple[bool, str]:
@@ -412,24 +670,34 @@ class ProjectValidator:
         Returns:
             (is_skill, reason)
         """
-        # 1. 检查技能仓库正面指示（优先级最高）
-        for indicator, reason in ProjectValidator.SKILL_REPO_INDICATORS:
-            if indicator == "_has_skills_dir":
-                # 特殊处理：检查 skills/ 目录是否包含技能
-                skills_dir = repo_dir / "skills"
-                if skills_dir.exists() and skills_dir.is_dir():
-                    # 检查是否有 3+ 个 SKILL.md
-                    skill_count = len(list(skills_dir.glob("*/SKILL.md")))
-                    if skill_count >= 3:
-                        return True, f"skills/ 目录包含 {skill_count} 个技能"
-            elif (repo_dir / indicator).exists():
-                return True, f"{reason}"
+        # 单次 scandir 建立根目录快照：后续指示文件/目录结构检查全部
+        # 变成内存集合操作（原实现 10+ 次 exists/glob，每次一个系统调用；
+        # DirEntry.is_dir 复用目录项类型信息，无需二次 stat）
+        try:
+            entries = list(os.scandir(repo_dir))
+        except OSError:
+            entries = []
+        names = {e.name for e in entries}
+        dir_names = {e.name for e in entries if e.is_dir(follow_symlinks=False)}
+        file_names = names - dir_names
+
+        # 1. 检查技能仓库正面指示（优先级最高）——展开为显式检查，
+        # 全部走快照集合；嵌套的 .claude/skills 只在 .claude 存在时才探测
+        if "SKILL.md" in names:
+            return True, "根目录有 SKILL.md 文件"
+        if "skills" in dir_names:
+            # 检查是否有 3+ 个 SKILL.md
+            skill_count = len(list((repo_dir / "skills").glob("*/SKILL.md")))
+            if skill_count >= 3:
+                return True, f"skills/ 目录包含 {skill_count} 个技能"
+        if ".claude" in dir_names and _cached_exists(str(repo_dir / ".claude" / "skills")):
+            return True, "Anthropic 官方技能仓库结构"
 
         # 2. 检查是否有 .skill 包文件（技能包仓库）
         for ext in ProjectValidator.SKILL_PACKAGE_EXTENSIONS:
-            skill_files = list(repo_dir.glob(f"*{ext}"))
-            if skill_files:
-                return True, f"包含技能包文件: {skill_files[0].name}"
+            skill_file = next((n for n in file_names if n.endswith(ext)), None)
+            if skill_file:
+                return True, f"包含技能包文件: {skill_file}"
 
         # 2.5 新增：检查子目录是否包含多个技能（monorepo 支持）
         # 在判定为工具项目之前，先检查子目录
@@ -440,23 +708,24 @@ class ProjectValidator:
             "scripts", "tools", "bin", "build", "dist", "target",
             ".git", ".github", ".vscode", ".idea",
         }
-        # 特殊优先级：skills/ 目录不排除
-        for item in repo_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
+        # 特殊优先级：skills/ 目录不排除（复用快照，免二次 iterdir）
+        for entry in entries:
+            if entry.name in dir_names and not entry.name.startswith("."):
+                item = repo_dir / entry.name
                 # skills/ 目录特殊处理：检查子目录中的技能
                 if item.name == "skills":
                     skill_count = 0
                     for sub_item in item.iterdir():
-                        if sub_item.is_dir() and (sub_item / "SKILL.md").exists():
+                        if sub_item.is_dir() and _cached_exists(str(sub_item / "SKILL.md")):
                             sub_skill_dirs.append(sub_item)
                             skill_count += 1
                     if skill_count >= 2:
                         return True, f"skills/ 目录包含 {skill_count} 个技能（monorepo）"
                 elif item.name not in exclude_dirs:
                     # 检查是否是技能目录（有 SKILL.md 或符合技能命名规范）
-                    if (item / "SKILL.md").exists():
+                    if _cached_exists(str(item / "SKILL.md")):
                         sub_skill_dirs.append(item)
-                    elif re.match(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$", item.name):
+                    elif _is_kebab_name(item.name):
                         # 检查是否有 markdown 文件（可能是技能内容）
                         md_files = list(item.glob("*.md"))
                         if md_files:
@@ -468,53 +737,66 @@ class ProjectValidator:
 
         # 3. 检查明确的工具项目文件
         for tool_file in ProjectValidator.TOOL_PROJECT_FILES:
-            if (repo_dir / tool_file).exists():
+            if tool_file in names:
                 return False, f"检测到工具项目文件: {tool_file}"
 
         # 4. 检查模糊的项目文件（需要进一步判断）
+        # 字节级扫描：只做子串查找，不需要把整个文件解码成 str
         for ambiguous_file in ProjectValidator.AMBIGUOUS_PROJECT_FILES:
             file_path = repo_dir / ambiguous_file
-            if file_path.exists():
+            if ambiguous_file in names:
+                try:
+                    data = file_path.read_bytes()
+                except OSError:
+                    continue
                 # 对于这些文件，需要检查内容和 README
                 if ambiguous_file == "pyproject.toml":
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
-                    # 检查是否明确是工具项目
-                    if "tool.scripts" in content or "command-line" in content.lower():
+                    # 检查是否明确是工具项目（单次合并扫描，忽略大小写）
+                    if ProjectValidator._TOOL_CONFIG_RE.search(data):
                         return False, f"检测到工具项目配置: {ambiguous_file}"
                     # 如果有 [project] 且是工具（不是技能打包），检查子目录
-                    if "[project]" in content:
-                        # 检查子目录是否都是工具组件
-                        subdirs = [d.name for d in repo_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
-                        tool_components = ProjectValidator.TOOL_COMPONENT_NAMES & set(subdirs)
+                    if b"[project]" in data:
+                        # 检查子目录是否都是工具组件（复用快照）
+                        subdirs = [n for n in dir_names if not n.startswith(".")]
+                        tool_components = ProjectValidator.TOOL_COMPONENT_NAMES.intersection(subdirs)
                         # 如果子目录大多是工具组件，判定为工具项目
                         if len(tool_components) >= 2 and len(tool_components) >= len(subdirs) * 0.5:
                             return False, f"检测到工具项目结构（包含工具组件目录）"
                     # 如果只是构建配置，继续检查 README
                 elif ambiguous_file == "package.json":
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
                     # 如果有很多 scripts，可能是 Node.js 工具
-                    if '"scripts"' in content and content.count('"') > 20:
+                    if b'"scripts"' in data and data.count(b'"') > 20:
                         return False, f"检测到 Node.js 工具项目: {ambiguous_file}"
 
-        # 5. 检查 README 内容（关键判断）
-        readme = ProjectValidator._read_readme(repo_dir)
+        # 5. 检查 README 内容（关键判断，从快照定位文件名免逐个 exists）
+        readme = ""
+        readme_name = next(
+            (n for n in ProjectValidator.README_NAMES if n in names),
+            None
+        )
+        if readme_name:
+            try:
+                with open(repo_dir / readme_name, "rb") as f:
+                    readme = f.read(ProjectValidator.README_SCAN_BYTES).decode(
+                        "utf-8", "ignore"
+                    )
+            except OSError:
+                readme = ""
         if readme:
-            content_lower = readme.lower()
-
             # 优先检查技能正面指示词
-            for indicator in ProjectValidator.SKILL_INDICATORS:
-                if indicator in content_lower:
-                    return True, f"README 包含技能指示词: {indicator}"
+            match = ProjectValidator._SKILL_INDICATOR_RE.search(readme)
+            if match:
+                return True, f"README 包含技能指示词: {match.group().lower()}"
 
             # 检查工具关键词
-            for keyword in ProjectValidator.NON_SKILL_KEYWORDS:
-                if keyword in content_lower:
-                    return False, f"README 包含工具项目关键词: {keyword}"
+            match = ProjectValidator._NON_SKILL_RE.search(readme)
+            if match:
+                return False, f"README 包含工具项目关键词: {match.group().lower()}"
 
-        # 6. 检查目录结构
-        subdirs = [d.name for d in repo_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
+        # 6. 检查目录结构（复用快照）
+        subdirs = [n for n in dir_names if not n.startswith(".")]
         # 如果有典型的工具项目目录结构
-        tool_dirs = ProjectValidator.TOOL_COMPONENT_NAMES & set(subdirs)
+        tool_dirs = ProjectValidator.TOOL_COMPONENT_NAMES.intersection(subdirs)
         if len(tool_dirs) >= 2:
             return False, f"检测到工具项目目录结构: {', '.join(list(tool_dirs)[:3])}"
 
@@ -535,33 +817,45 @@ class ProjectValidator:
         if dirname in ProjectValidator.TOOL_COMPONENT_NAMES:
             return False, f"目录名是工具组件: {dirname}"
 
+        # 单次 listdir 取目录项集合，后续标志检查均为内存集合操作
+        # （原实现为 SKILL.md/__init__.py 两次 exists + 一次 glob，共 3 次目录访问）
+        try:
+            entry_names = set(os.listdir(subdir))
+        except OSError:
+            entry_names = set()
+
         # 2. 检查是否有 SKILL.md（最明确的技能标志）
-        if (subdir / "SKILL.md").exists():
+        if "SKILL.md" in entry_names:
             return True, "包含 SKILL.md 文件"
 
         # 3. 检查是否是 Python 包目录（有 __init__.py 但无 SKILL.md）
-        if (subdir / "__init__.py").exists():
+        if "__init__.py" in entry_names:
             return False, "Python 包目录（无 SKILL.md）"
 
         # 4. 检查目录名格式：技能名通常是 kebab-case
-        if not re.match(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$", dirname):
+        if not _is_kebab_name(dirname):
             return False, f"目录名不符合技能命名规范: {dirname}"
 
         # 5. 检查是否有 .md 文件（可能是技能内容）
-        md_files = list(subdir.glob("*.md"))
-        if not md_files:
+        if not any(name.endswith(".md") for name in entry_names):
             return False, "没有找到 markdown 文件"
 
         # 默认：可能是技能
         return True, ""
 
+    # README 候选文件名（按优先级）
+    README_NAMES = ("README.md", "README.txt", "README.rst", "readme.md")
+
     @staticmethod
     def _read_readme(directory: Path) -> str:
-        """读取 README 文件内容"""
-        for readme_name in ["README.md", "README.txt", "README.rst", "readme.md"]:
-            readme_path = directory / readme_name
-            if readme_path.exists():
-                return readme_path.read_text(encoding="utf-8", errors="ignore")
+        """读取 README 文件内容（单次 scandir 定位，免逐个 exists 探测）"""
+        try:
+            names = {e.name for e in os.scandir(directory)}
+        except OSError:
+            return ""
+        for readme_name in ProjectValidator.README_NAMES:
+            if readme_name in names:
+                return (directory / readme_name).read_text(encoding="utf-8", errors="ignore")
         return ""
 
     @staticmethod
@@ -615,23 +909,25 @@ class SkillNormalizer:
     """将各种格式标准化为官方 SKILL.md 格式"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def validate_skill_name(name: str) -> Tuple[bool, str]:
-        """验证技能名称是否符合规范"""
+        """验证技能名称是否符合规范（纯函数，同名重复校验直接命中缓存）"""
         if not name:
             return False, "技能名称不能为空"
 
         if len(name) > MAX_NAME_LENGTH:
             return False, f"技能名称过长（最多 {MAX_NAME_LENGTH} 字符）"
 
-        if not SKILL_NAME_PATTERN.match(name):
+        if not _is_kebab_name(name):
             return False, "技能名称必须是小写字母、数字和连字符，不能以连字符开头或结尾"
 
         return True, ""
 
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def validate_description(desc: str) -> Tuple[bool, str]:
-        """验证描述是否符合规范"""
+        """验证描述是否符合规范（纯函数，重复校验直接命中缓存）"""
         if not desc:
             return False, "描述不能为空"
 
@@ -640,17 +936,19 @@ class SkillNormalizer:
 
         # 检查是否包含潜在的 HTML 标签（更精确的模式）
         # 允许单独的 < 和 > 字符（如 >5, C++, <3），但拒绝 <tag> 格式
-        if re.search(r'<[^>]+>', desc):
+        # 先做廉价的字符预筛，绝大多数描述不含尖括号，不必进正则
+        if "<" in desc and ">" in desc and _HTML_TAG_RE.search(desc):
             return False, "描述不能包含 HTML 标签"
 
         return True, ""
 
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def normalize_skill_name(original_name: str) -> str:
-        """将任意名称标准化为 hyphen-case 格式"""
+        """将任意名称标准化为 hyphen-case 格式（纯函数，带 LRU 缓存）"""
         # 移除特殊字符，转为小写，用连字符连接
-        normalized = re.sub(r"[^a-zA-Z0-9]+", "-", original_name).strip("-").lower()
+        normalized = _NORMALIZE_RE.sub("-", original_name).strip("-").lower()
         # 移除开头的数字
         if normalized and normalized[0].isdigit():
             normalized = "skill-" + normalized
@@ -677,12 +975,39 @@ class SkillNormalizer:
         # 提取 frontmatter 内容
         yaml_content = content[4:end_marker].strip()
 
-        # 优先使用 yaml.safe_load
+        # 快路径：实际仓库的 frontmatter 几乎都是几行简单 key: value，
+        # 手工解析即可；遇到 YAML 复杂结构（缩进续行、列表/映射/块标量、
+        # 锚点）才降级到 yaml 解析器
+        result: Dict[str, Any] = {}
+        needs_yaml = False
+        for line in yaml_content.split('\n'):
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            if line[0] in ' \t':
+                needs_yaml = True
+                break
+            key, sep, value = line.partition(':')
+            if not sep:
+                needs_yaml = True
+                break
+            value = value.strip()
+            # 行内注释（name: foo # note）交给 yaml 解析器剥离
+            if value and (value[0] in '[{|>&*' or '#' in value):
+                needs_yaml = True
+                break
+            result[key.strip()] = value.strip('"').strip("'")
+        if not needs_yaml:
+            return result
+
+        # 惰性导入 yaml；优先 libyaml 的 C 加载器
+        import yaml
         try:
-            frontmatter = yaml.safe_load(yaml_content)
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            frontmatter = yaml.load(yaml_content, Loader=loader)
             if isinstance(frontmatter, dict):
                 return frontmatter
-        except (yaml.YAMLError, Exception):
+        except Exception:
             pass
 
         # 降级：手动解析（处理简单 key: value 格式）
@@ -704,12 +1029,10 @@ class SkillNormalizer:
         """
         skill_md = skill_dir / "SKILL.md"
 
-        if not skill_md.exists():
+        content = _read_skill_md(skill_md)
+        if content is None:
             return False, "SKILL.md 不存在"
 
-        with open(skill_md, "r", encoding="utf-8") as f:
-            content = f.read()
-
         frontmatter = SkillNormalizer.extract_frontmatter(content)
 
         # 检查必需字段
@@ -742,11 +1065,13 @@ class SkillNormalizer:
                 needs_fix = True
 
         if needs_fix:
-            # 重建 frontmatter
-            new_frontmatter = "---\n"
-            new_frontmatter += f'name: {frontmatter["name"]}\n'
-            new_frontmatter += f'description: "{frontmatter["description"]}"\n'
-            new_frontmatter += "---\n\n"
+            # 重建 frontmatter（单次 f-string 拼接，免多段累加的中间字符串）
+            new_frontmatter = (
+                f'---\n'
+                f'name: {frontmatter["name"]}\n'
+                f'description: "{frontmatter["description"]}"\n'
+                f'---\n\n'
+            )
 
             # 保留原有内容（移除旧 frontmatter）
             content_start = content.find("\n---", 4)
@@ -763,21 +1088,36 @@ class SkillNormalizer:
     @staticmethod
     def _extract_description_from_content(content: str) -> str:
         """从内容中提取描述"""
-        lines = content.split("\n")
-
-        # 跳过 frontmatter
-        start_idx = 0
-        for i, line in enumerate(lines):
-            if line.strip() == "---" and i > 0:
-                start_idx = i + 1
+        # 用 find 逐行游标扫描，不把整个文件 split 成行列表
+        # （大 SKILL.md 只需要 frontmatter 之后的前几行）
+        n = len(content)
+
+        # 跳过 frontmatter：定位第一个非首行的独立 "---" 行
+        start = 0
+        pos = content.find("\n")
+        while pos != -1:
+            line_start = pos + 1
+            nl = content.find("\n", line_start)
+            line_end = nl if nl != -1 else n
+            if content[line_start:line_end].strip() == "---":
+                start = line_end + 1
                 break
+            pos = nl
 
-        # 查找第一个标题或段落
-        for i in range(start_idx, min(start_idx + 10, len(lines))):
-            line = lines[i].strip()
+        # 查找第一个标题或段落（最多看 10 行）
+        pos = start
+        for _ in range(10):
+            if pos >= n:
+                break
+            nl = content.find("\n", pos)
+            line_end = nl if nl != -1 else n
+            line = content[pos:line_end].strip()
             if line and not line.startswith("#"):
                 # 返回第一个非空行作为描述（限制长度）
                 return line[:200] + "..." if len(line) > 200 else line
+            if nl == -1:
+                break
+            pos = nl + 1
 
         return "自动生成的技能描述，请手动完善"
 
@@ -796,25 +1136,27 @@ class SkillNormalizer:
         format_type, markers = FormatDetector.detect_skill_format(source_dir)
         info(f"检测到格式: {format_type}")
 
-        # 2. 创建目标目录
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        # 3. 根据格式处理
+        # 2. 根据格式处理
         if format_type == "official":
             # 已经是官方格式，直接复制
+            # （_copy_directory 的 copytree 自建目标目录，提前 mkdir
+            #   只会创建一个马上被 rmtree 的空目录）
             SkillNormalizer._copy_directory(source_dir, target_dir)
-        elif format_type == "claude-plugin":
-            # Claude Plugin 格式
-            SkillNormalizer._convert_claude_plugin(source_dir, target_dir)
-        elif format_type == "agent-skills":
-            # Agent Skills 格式
-            SkillNormalizer._convert_agent_skills(source_dir, target_dir)
-        elif format_type == "cursor-rules":
-            # Cursor Rules 格式
-            SkillNormalizer._convert_cursor_rules(source_dir, target_dir)
         else:
-            # 未知格式，尝试通用转换
-            SkillNormalizer._convert_generic(source_dir, target_dir)
+            # 转换分支由各 handler 向目标目录写文件，目录在此统一创建
+            target_dir.mkdir(parents=True, exist_ok=True)
+            if format_type == "claude-plugin":
+                # Claude Plugin 格式
+                SkillNormalizer._convert_claude_plugin(source_dir, target_dir)
+            elif format_type == "agent-skills":
+                # Agent Skills 格式
+                SkillNormalizer._convert_agent_skills(source_dir, target_dir)
+            elif format_type == "cursor-rules":
+                # Cursor Rules 格式
+                SkillNormalizer._convert_cursor_rules(source_dir, target_dir)
+            else:
+                # 未知格式，尝试通用转换
+                SkillNormalizer._convert_generic(source_dir, target_dir)
 
         # 4. 修复 frontmatter
         needs_fix, new_content = SkillNormalizer.fix_frontmatter(target_dir)
@@ -823,20 +1165,33 @@ class SkillNormalizer:
             with open(target_dir / "SKILL.md", "w", encoding="utf-8") as f:
                 f.write(new_content)
 
+        # 转换写入了新文件，作废存在性缓存
+        invalidate_fs_cache()
+
         return True, f"转换完成: {target_dir.name}"
 
 
+    @staticmethod
+    def _fast_copytree(source: Path, target: Path) -> None:
+        """内容复制：copyfile 代替默认 copy2，跳过逐文件的 copystat
+        元数据同步（转换产物不需要保留源 mtime/权限），文件数据走
+        sendfile / CopyFile2 零拷贝快路径"""
+        import shutil
+        shutil.copytree(source, target, dirs_exist_ok=True, copy_function=shutil.copyfile)
+
     @staticmethod
     def _copy_directory(source: Path, target: Path) -> None:
         """复制目录内容"""
+        import shutil
         if target.exists():
             shutil.rmtree(target)
-        shutil.copytree(source, target, dirs_exist_ok=True)
+        SkillNormalizer._fast_copytree(source, target)
 
 
     @staticmethod
     def _convert_claude_plugin(source: Path, target: Path) -> None:
         """转换 Claude Plugin 格式"""
+        import shutil
         # 查找 SKILL.md 或 README.md
         skill_md = source / "SKILL.md"
         if skill_md.exists():
@@ -857,14 +1212,15 @@ class SkillNormalizer:
                 continue
             dest = target / item.name
             if item.is_dir():
-                shutil.copytree(item, dest, dirs_exist_ok=True)
+                SkillNormalizer._fast_copytree(item, dest)
             else:
-                shutil.copy2(item, dest)
+                shutil.copyfile(item, dest)
 
 
     @staticmethod
     def _convert_agent_skills(source: Path, target: Path) -> None:
         """转换 Agent Skills 格式"""
+        import shutil
         # Agent Skills 通常已经有 SKILL.md
         skill_md = source / "SKILL.md"
         if skill_md.exists():
@@ -874,7 +1230,7 @@ class SkillNormalizer:
         for subdir in ["scripts", "references", "examples", "templates"]:
             src_subdir = source / subdir
             if src_subdir.exists():
-                shutil.copytree(src_subdir, target / subdir, dirs_exist_ok=True)
+                SkillNormalizer._fast_copytree(src_subdir, target / subdir)
 
 
     @staticmethod
@@ -886,15 +1242,22 @@ class SkillNormalizer:
             rules_dir = source / "rules"
 
         if rules_dir.exists():
-            # 合并所有 .md 文件
+            # 合并所有 .md 文件（scandir 的 DirEntry 类型判断免逐项 stat）
+            # 按字节读入、字节拼接，最后只解码一次，避免逐文件 decode
             content_parts = []
-            for md_file in sorted(rules_dir.glob("*.md")):
-                with open(md_file, "r", encoding="utf-8") as f:
+            with os.scandir(rules_dir) as it:
+                md_names = sorted(
+                    e.name for e in it
+                    if e.is_file(follow_symlinks=False) and e.name.endswith(".md")
+                )
+            for md_name in md_names:
+                with open(rules_dir / md_name, "rb") as f:
                     content_parts.append(f.read())
 
             if content_parts:
+                merged = b"\n\n".join(content_parts).decode("utf-8", "ignore")
                 SkillNormalizer._create_skill_md_from_content(
-                    target, source.name, "\n\n".join(content_parts)
+                    target, source.name, merged
                 )
         else:
             SkillNormalizer._convert_generic(source, target)
@@ -903,6 +1266,7 @@ class SkillNormalizer:
     @staticmethod
     def _convert_generic(source: Path, target: Path) -> None:
         """通用转换（未知格式）"""
+        import shutil
         # 查找 SKILL.md 或 README.md
         skill_md = source / "SKILL.md"
         readme_md = source / "README.md"
@@ -940,6 +1304,8 @@ description: "{desc}"
     @staticmethod
     def _create_default_skill_md(source: Path, target: Path) -> None:
         """创建默认的 SKILL.md"""
+        import shutil
+        from datetime import datetime
         name = SkillNormalizer.normalize_skill_name(source.name)
 
         content = f"""---
@@ -971,15 +1337,15 @@ description: "从 {source.name} 自动转换的技能，请手动完善描述"
         with open(target / "SKILL.md", "w", encoding="utf-8") as f:
             f.write(content)
 
-        # 复制其他文件
+        # 复制其他文件（copyfile 零拷贝路径，转换产物不需要保留源元数据）
         for item in source.iterdir():
             if item.name != "SKILL.md" and not item.name.startswith("."):
                 dest = target / item.name
                 if item.is_dir():
-                    shutil.copytree(item, dest, dirs_exist_ok=True)
+                    SkillNormalizer._fast_copytree(item, dest)
                 else:
                     dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(item, dest)
+                    shutil.copyfile(item, dest)
 
 
     @staticmethod
@@ -1026,23 +1392,6 @@ description: "{description}"
             SkillNormalizer._create_default_skill_md(plugin_json.parent.parent, target)
 
 
-# =============================================================================
-# 技能安装器
-# =============================================================================
-
-
-if TINYDB_AVAILABLE:
-    class UTF8JSONStorage(JSONStorage):
-        """自定义 JSONStorage，强制使用 UTF-8 编码（修复 Windows GBK 问题）"""
-
-        def __init__(self, path, **kwargs):
-            # 强制使用 UTF-8 编码
-            kwargs['encoding'] = 'utf-8'
-            super().__init__(path, **kwargs)
-else:
-    UTF8JSONStorage = None
-
-
 # =============================================================================
 # 数据库连接管理器
 # =============================================================================
@@ -1052,18 +1401,18 @@ from contextlib import contextmanager
 @contextmanager
 def db_connection():
     """
-    数据库连接上下文管理器
+    数据库连接上下文管理器（tinydb 惰性导入，不可用时给出 (None, None)）
 
     用法:
         with db_connection() as (db, Skill):
             # 使用 db 和 Skill
             result = db.search(Skill.name == "test")
     """
-    if not TINYDB_AVAILABLE:
+    TinyDB, Query, UTF8JSONStorage = _get_tinydb()
+    if TinyDB is None:
         yield None, None
         return
 
-    db = None
     try:
         SKILLS_DB_FILE.parent.mkdir(parents=True, exist_ok=True)
         db = TinyDB(SKILLS_DB_FILE, storage=UTF8JSONStorage)
@@ -1081,6 +1430,16 @@ def db_connection():
 class SkillInstaller:
     """将转换后的技能安装到 .claude/skills/"""
 
+    # 一次正则匹配替代 urlparse + split + 分支判断；tree/<branch> 之后的
+    # 部分落入 subpath 组，其余形式的尾部路径落入 rest 组
+    _GITHUB_URL_RE = re.compile(
+        r"^https?://(?:www\.)?github\.com/"
+        r"(?P<author>[^/?#]+)/(?P<repo>[^/?#]+?)(?:\.git)?"
+        r"(?:/tree/[^/?#]+(?:/(?P<subpath>[^?#]+?))?|/(?P<rest>[^?#]+?))?"
+        r"/?(?:[?#].*)?$"
+    )
+    _GITHUB_SHORT_RE = re.compile(r"^(?P<author>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$")
+
     @staticmethod
     def _extract_github_info(github_url: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """从 GitHub URL 提取 author、repo 和子路径
@@ -1096,54 +1455,27 @@ class SkillInstaller:
             (author, repo, subpath)
             subpath: 可选的子路径（如 "skills/agent"），用于定位子技能
         """
-        from urllib.parse import urlparse
-
-        subpath = None
-
-        if "github.com" in github_url:
-            # 完整 URL 格式
-            parsed = urlparse(github_url)
-            path_parts = parsed.path.rstrip('/').split('/')
-
-            # 基本结构: /author/repo/...
-            if len(path_parts) >= 3 and path_parts[0] == '':
-                author = path_parts[1]
-                repo = path_parts[2]
-
-                # 检查是否有子路径 (tree/branch/skills/...)
-                if len(path_parts) > 3:
-                    # 跳过 "tree" 和分支名
-                    if len(path_parts) > 4 and path_parts[3] == "tree":
-                        # 子路径从分支名之后开始
-                        subpath = '/'.join(path_parts[5:]) if len(path_parts) > 5 else None
-                    else:
-                        # 其他格式的子路径
-                        subpath = '/'.join(path_parts[3:]) if len(path_parts) > 3 else None
+        url = github_url.strip()
+        m = SkillInstaller._GITHUB_URL_RE.match(url)
+        if m:
+            subpath = m.group("subpath") or m.group("rest") or None
+            return m.group("author"), m.group("repo"), subpath
 
-                return author, repo, subpath
-        else:
+        if "github.com" not in url:
             # 简写格式: author/repo
-            if '/' in github_url:
-                parts = github_url.rstrip('/').split('/')
-                if len(parts) == 2:
-                    return parts[0], parts[1], None
+            m = SkillInstaller._GITHUB_SHORT_RE.match(url)
+            if m:
+                return m.group("author"), m.group("repo"), None
 
         return None, None, None
 
     @staticmethod
     def _get_skill_name_from_md(skill_dir: Path) -> Optional[str]:
-        """从 SKILL.md 读取 name 字段"""
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
-            return None
-
-        try:
-            with open(skill_md, "r", encoding="utf-8") as f:
-                content = f.read()
-            frontmatter = SkillNormalizer.extract_frontmatter(content)
-            return frontmatter.get("name")
-        except Exception:
+        """从 SKILL.md 读取 name 字段（读取与解析均走共享缓存）"""
+        frontmatter = _skill_frontmatter(skill_dir / "SKILL.md")
+        if frontmatter is None:
             return None
+        return frontmatter.get("name")
 
     @staticmethod
     def _load_cache_meta(skill_dir: Path) -> Tuple[Optional[str], Optional[str]]:
@@ -1182,27 +1514,29 @@ class SkillInstaller:
         return None, None
 
     @staticmethod
-    def _extract_from_local_skill(skill_name: str, author: str = "", repo: str = "") -> Optional[Dict]:
+    def _extract_from_local_skill(skill_name: str, author: str = "", repo: str = "",
+                                  skill_path: Optional[Path] = None) -> Optional[Dict]:
         """从本地 SKILL.md 提取完整元数据
 
         Args:
             skill_name: 技能文件夹名
             author: GitHub 作者名（从安装链接解析，用于 parent_repo 字段）
             repo: GitHub 仓库名（从安装链接解析，用于 repo 字段）
+            skill_path: 可选的技能目录（批量安装时指向暂存目录）
         """
-        skill_path = CLAUDE_SKILLS_DIR / skill_name
+        if skill_path is None:
+            skill_path = CLAUDE_SKILLS_DIR / skill_name
         skill_md = skill_path / "SKILL.md"
 
-        if not skill_md.exists():
+        frontmatter = _skill_frontmatter(skill_md)
+        if frontmatter is None:
             return None
 
         try:
-            content = skill_md.read_text(encoding='utf-8')
-            frontmatter = SkillNormalizer.extract_frontmatter(content)
-
             # 提取描述（如果 frontmatter 没有）
             description = frontmatter.get("description", "")
             if not description:
+                content = _read_skill_md(skill_md) or ""
                 description = SkillNormalizer._extract_description_from_content(content)
 
             # 构建 parent_repo: author/repo 格式
@@ -1212,13 +1546,28 @@ class SkillInstaller:
             elif author:
                 parent_repo_value = author
 
+            # tags 只取一次；搜索索引单次 join + 单次 lower，
+            # 免去重复的默认列表拷贝和中间字符串
+            tags = frontmatter.get("tags")
+            if tags is None:
+                tags = list(DEFAULT_SKILL_TAGS)
+
+            # 索引串拼法不变（子串匹配方不受影响），同时预存小写分词
+            # 列表：查询侧可直接做集合成员判断，免每次查询重新 lower+扫描
+            search_index = " ".join(
+                [skill_name, frontmatter.get("category", ""), *tags]
+            ).lower()
+            search_tokens = list(dict.fromkeys(
+                [*skill_name.lower().split("-"), *search_index.split()]
+            ))
+
             return {
-                "id": skill_name.lower().replace('_', '-'),
+                "id": _make_skill_id(skill_name),
                 "name": frontmatter.get("name", skill_name),
                 "folder_name": skill_name,
                 "description": description or f"{skill_name} 技能",
                 "category": frontmatter.get("category", DEFAULT_SKILL_CATEGORY),
-                "tags": frontmatter.get("tags", DEFAULT_SKILL_TAGS.copy()),
+                "tags": tags,
                 "keywords_cn": [],
                 "parent": "",
                 "parent_repo": parent_repo_value,
@@ -1226,9 +1575,10 @@ class SkillInstaller:
                 "stars": "",
                 "install": f".claude/skills/{skill_name}",
                 "source_file": "auto_created",
-                "search_index": f"{skill_name} {frontmatter.get('category', '')} {' '.join(frontmatter.get('tags', DEFAULT_SKILL_TAGS.copy()))}".lower(),
-                "last_updated": datetime.now().strftime("%Y-%m-%d"),
-                "synced_at": datetime.now().strftime("%Y-%m-%d"),
+                "search_index": search_index,
+                "search_tokens": search_tokens,
+                "last_updated": _today_str(),
+                "synced_at": _today_str(),
             }
         except Exception as e:
             warn(f"提取技能元数据失败: {e}")
@@ -1260,27 +1610,82 @@ class SkillInstaller:
                 warn(f"无法提取技能元数据: {skill_name}")
                 return False
 
-            # 检查是否已存在（按 folder_name 匹配）
-            existing = db.get(Skill.folder_name == skill_name)
-            if existing:
-                # 更新现有记录
-                metadata["installed"] = True
-                metadata["installed_path"] = f".claude/skills/{skill_name}"
-                # 保留原有的 keywords_cn
-                if existing.get("keywords_cn"):
-                    metadata["keywords_cn"] = existing["keywords_cn"]
-                db.update(metadata, doc_ids=[existing.doc_id])
-            else:
-                # 新增记录
-                metadata["installed"] = True
-                metadata["installed_path"] = f".claude/skills/{skill_name}"
-                db.insert(metadata)
+            metadata["installed"] = True
+            metadata["installed_path"] = metadata["install"]
+            # upsert 单次扫描即可完成“存在则更新、否则插入”；
+            # 更新时 TinyDB 按字段合并，弹出空的 keywords_cn 即可保留
+            # 库中已有的值（读取方均用 .get，新记录缺省该字段无影响）
+            if not metadata.get("keywords_cn"):
+                metadata.pop("keywords_cn", None)
+            db.upsert(metadata, Skill.folder_name == skill_name)
 
             return True
         except Exception as e:
             warn(f"数据库同步失败: {e}")
             return False
 
+    @staticmethod
+    def _sync_skills_to_db_bulk(skills: List[Tuple[str, str, str, str]]) -> Dict[str, bool]:
+        """批量将技能同步到数据库（单次连接 + 合并写入）
+
+        TinyDB 每次 insert/update 都整文件重写，逐技能同步时 N 个技能
+        即 N 次全量 JSON 序列化；这里用一次 db.all() 建立现有记录索引，
+        再合并为至多一次 update_multiple + 一次 insert_multiple。
+
+        Args:
+            skills: [(folder_name, author, repo, skill_path), ...]
+                    skill_path 为读取 SKILL.md 的目录（暂存目录或最终目录）
+
+        Returns:
+            {folder_name: success_flag}
+        """
+        results: Dict[str, bool] = {}
+        with db_connection() as (db, Skill):
+            if db is None:
+                return {name: False for name, _, _, _ in skills}
+
+            try:
+                existing_by_folder = {doc.get("folder_name"): doc for doc in db.all()}
+            except Exception as e:
+                warn(f"数据库读取失败: {e}")
+                return {name: False for name, _, _, _ in skills}
+
+            updates = []
+            inserts = []
+            for skill_name, author, repo, skill_path in skills:
+                metadata = SkillInstaller._extract_from_local_skill(
+                    skill_name, author, repo, skill_path=skill_path
+                )
+                if not metadata:
+                    warn(f"无法提取技能元数据: {skill_name}")
+                    results[skill_name] = False
+                    continue
+
+                metadata["installed"] = True
+                metadata["installed_path"] = metadata["install"]
+                existing = existing_by_folder.get(skill_name)
+                if existing is not None:
+                    # 保留原有的 keywords_cn
+                    if existing.get("keywords_cn"):
+                        metadata["keywords_cn"] = existing["keywords_cn"]
+                    updates.append((metadata, Skill.folder_name == skill_name))
+                else:
+                    inserts.append(metadata)
+                results[skill_name] = True
+
+            try:
+                if updates:
+                    db.update_multiple(updates)
+                if inserts:
+                    db.insert_multiple(inserts)
+            except Exception as e:
+                warn(f"数据库同步失败: {e}")
+                for skill_name, _, _, _ in skills:
+                    if results.get(skill_name):
+                        results[skill_name] = False
+
+        return results
+
     @staticmethod
     def _remove_skill_from_db(skill_name: str) -> bool:
         """从数据库移除技能记录"""
@@ -1324,17 +1729,12 @@ class SkillInstaller:
     @staticmethod
     def _validate_skill_structure(skill_dir: Path) -> Tuple[bool, str]:
         """验证技能目录结构"""
-        # 检查 SKILL.md 是否存在
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
+        # 走共享缓存：批量安装时 _get_skill_name_from_md 已读取并解析过
+        # 同一文件，这里读与解析都直接命中缓存
+        frontmatter = _skill_frontmatter(skill_dir / "SKILL.md")
+        if frontmatter is None:
             return False, "SKILL.md 不存在"
 
-        # 检查 frontmatter
-        with open(skill_md, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        frontmatter = SkillNormalizer.extract_frontmatter(content)
-
         # 检查必需字段
         for field in REQUIRED_FIELDS:
             if field not in frontmatter:
@@ -1370,14 +1770,26 @@ def batch_install(skill_dirs: List[Path], force: bool = False, author: Optional[
     Returns:
         {"success": [...], "failed": [...], "skipped": [...]}
     """
+    import shutil
+
     results = {
         "success": [],
         "failed": [],
         "skipped": [],
     }
 
-    # 批量复制所有技能文件
-    copied_skills = []
+    # 阶段1：串行完成名称解析与验证，收集待复制任务
+    # 已安装技能名快照：一次 scandir 代替逐技能的 exists() 探测
+    try:
+        existing_names = {e.name for e in os.scandir(CLAUDE_SKILLS_DIR)}
+    except OSError:
+        existing_names = set()
+
+    # 热循环内用 str 拼路径：os.path.join 比 Path.__truediv__ 少走
+    # 一次 PurePath 解析与对象分配，shutil/os 接口均直接接受 str
+    skills_root = str(CLAUDE_SKILLS_DIR)
+
+    copy_jobs = []  # (skill_dir, skill_name, target_dir, author, repo)
     for skill_dir in skill_dirs:
         # 获取原始路径（如果有映射），保留 .meta.json 访问能力
         original_dir = install_path_to_original.get(skill_dir, skill_dir) if install_path_to_original else skill_dir
@@ -1425,18 +1837,54 @@ def batch_install(skill_dirs: List[Path], force: bool = False, author: Optional[
             results["failed"].append({"name": skill_name, "message": f"名称验证失败: {msg}"})
             continue
 
-        # 检查是否已存在
-        target_dir = CLAUDE_SKILLS_DIR / skill_name
-        if target_dir.exists():
-            if not force:
-                results["skipped"].append({"name": skill_name, "message": f"技能已存在"})
-                continue
-            shutil.rmtree(target_dir)
+        # 检查是否已存在（查快照集合；同批出现重名也会在这里被拦下）。
+        # force 覆盖不在验证阶段动盘：验证全程只读，旧版本保持可用，
+        # 提交时才挪开旧目录（见阶段3落位）
+        target_dir = os.path.join(skills_root, skill_name)
+        if skill_name in existing_names and not force:
+            results["skipped"].append({"name": skill_name, "message": f"技能已存在"})
+            continue
 
-        # 复制文件
+        # 先复制到同目录下的隐藏暂存目录，数据库同步成功后再一次
+        # rename 落位：外部观察不到半安装状态，回滚只删暂存目录
+        staging_dir = os.path.join(skills_root, f".{skill_name}.tmp{os.getpid()}")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        copy_jobs.append((skill_dir, skill_name, staging_dir, target_dir,
+                          skill_author or "", skill_repo or ""))
+        existing_names.add(skill_name)
+
+    # 阶段2：复制文件。同文件系统优先硬链接（纯元数据操作，免逐字节
+    # 复制），跨设备等不支持硬链接的场景回退为普通复制；各目标目录互相
+    # 独立，I/O 密集操作多技能时并行执行（线程在系统调用期间释放 GIL）
+    def _copy_one(src: Path, dst: str) -> None:
         try:
-            shutil.copytree(skill_dir, target_dir)
-            copied_skills.append((skill_name, target_dir, skill_author or "", skill_repo or ""))
+            shutil.copytree(src, dst, copy_function=os.link)
+        except OSError:
+            if os.path.exists(dst):
+                shutil.rmtree(dst, ignore_errors=True)
+            # copyfile 而非默认 copy2：跳过逐文件元数据同步，走
+            # sendfile / CopyFile2 零拷贝快路径（大二进制资产受益明显）
+            shutil.copytree(src, dst, copy_function=shutil.copyfile)
+
+    copied_skills = []
+    if len(copy_jobs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(copy_jobs))) as ex:
+            futures = [
+                (ex.submit(_copy_one, src, staging), name, staging, tgt, a, r)
+                for src, name, staging, tgt, a, r in copy_jobs
+            ]
+            for future, skill_name, staging_dir, target_dir, a, r in futures:
+                try:
+                    future.result()
+                    copied_skills.append((skill_name, staging_dir, target_dir, a, r))
+                except Exception as e:
+                    results["failed"].append({"name": skill_name, "message": f"复制失败: {e}"})
+    elif copy_jobs:
+        src, skill_name, staging_dir, target_dir, a, r = copy_jobs[0]
+        try:
+            _copy_one(src, staging_dir)
+            copied_skills.append((skill_name, staging_dir, target_dir, a, r))
         except Exception as e:
             results["failed"].append({"name": skill_name, "message": f"复制失败: {e}"})
 
@@ -1448,16 +1896,17 @@ def batch_install(skill_dirs: List[Path], force: bool = False, author: Optional[
     safe_skills = []
 
     if scan_results:
-        for skill_name, target_dir, skill_author, skill_repo in copied_skills:
+        for entry in copied_skills:
+            skill_name, staging_dir, target_dir = entry[0], entry[1], entry[2]
             scan_result = scan_results.get(skill_name, {"status": "skipped"})
 
             if scan_result.get("status") == "skipped":
-                safe_skills.append((skill_name, target_dir, skill_author, skill_repo))
+                safe_skills.append(entry)
             elif scan_result.get("severity") in ["SAFE", "LOW"]:
-                safe_skills.append((skill_name, target_dir, skill_author, skill_repo))
+                safe_skills.append(entry)
             else:
                 threatened_skills.append((skill_name, target_dir, scan_result))
-                safe_skills.append((skill_name, target_dir, skill_author, skill_repo))
+                safe_skills.append(entry)
 
         # 构建威胁详情
         threat_details = []
@@ -1477,7 +1926,7 @@ def batch_install(skill_dirs: List[Path], force: bool = False, author: Optional[
                     }
                     for t in threats[:5]
                 ],
-                "target_dir": str(target_dir)
+                "target_dir": target_dir
             }
             threat_details.append(threat_info)
 
@@ -1486,17 +1935,39 @@ def batch_install(skill_dirs: List[Path], force: bool = False, author: Optional[
     else:
         safe_skills = copied_skills
 
-    # 批量写入数据库
-    with db_connection() as (db, Skill):
-        for skill_name, target_dir, skill_author, skill_repo in safe_skills:
-            db_sync_success = SkillInstaller._sync_skill_to_db(skill_name, skill_author, skill_repo, db, Skill)
-            if db_sync_success:
-                success(f"✅ 安装成功: {skill_name} (数据库已同步)")
-                results["success"].append({"name": skill_name, "message": "安装成功"})
-            else:
-                # 数据库同步失败，回滚
-                shutil.rmtree(target_dir)
-                results["failed"].append({"name": skill_name, "message": "数据库同步失败，已回滚"})
+    # 批量写入数据库（合并为至多两次 TinyDB 文件重写；元数据从暂存目录读取）
+    sync_results = SkillInstaller._sync_skills_to_db_bulk(
+        [(name, a, r, staging) for name, staging, _tgt, a, r in safe_skills]
+    )
+    rollback_names = []  # rename 落位失败需要回补删除的数据库记录
+    for skill_name, staging_dir, target_dir, skill_author, skill_repo in safe_skills:
+        if sync_results.get(skill_name):
+            # 提交点：旧目录（force 覆盖时）先挪到隐藏名，再单次
+            # rename 落位，最后清理旧版本
+            old_aside = None
+            try:
+                if os.path.lexists(target_dir):
+                    old_aside = os.path.join(skills_root, f".{skill_name}.old{os.getpid()}")
+                    shutil.rmtree(old_aside, ignore_errors=True)
+                    os.replace(target_dir, old_aside)
+                os.replace(staging_dir, target_dir)
+                if old_aside is not None:
+                    _discard_dir(old_aside)
+            except OSError as e:
+                _discard_dir(staging_dir)
+                rollback_names.append(skill_name)
+                results["failed"].append({"name": skill_name, "message": f"安装落位失败: {e}"})
+                continue
+            success(f"✅ 安装成功: {skill_name} (数据库已同步)")
+            results["success"].append({"name": skill_name, "message": "安装成功"})
+        else:
+            # 数据库同步失败，回滚（目标目录从未出现过，弃置暂存即可）
+            _discard_dir(staging_dir)
+            results["failed"].append({"name": skill_name, "message": "数据库同步失败，已回滚"})
+
+    # 回补删除合并为一次连接（每技能单开连接即 TinyDB 整文件重写一次）
+    if rollback_names:
+        SkillInstaller.batch_remove_from_db(rollback_names)
 
     # 失效搜索索引缓存
     if results["success"]:
@@ -1510,47 +1981,47 @@ def batch_install(skill_dirs: List[Path], force: bool = False, author: Optional[
 # =============================================================================
 
 _config_cache: Optional[dict] = None
-_config_mtime: Optional[float] = None
+_config_mtime_ns: Optional[int] = None
 
 def load_config(use_cache: bool = True) -> dict:
-    """加载配置文件"""
-    global _config_cache, _config_mtime
+    """加载配置文件（单次 os.stat 兼做存在性探测与 mtime 读取）"""
+    global _config_cache, _config_mtime_ns
     config_file = BASE_DIR / "config.json"
-    if not config_file.exists():
+    try:
+        st = os.stat(config_file)
+    except OSError:
         return {}
-    current_mtime = config_file.stat().st_mtime
-    if use_cache and _config_cache is not None and _config_mtime == current_mtime:
+    if use_cache and _config_cache is not None and _config_mtime_ns == st.st_mtime_ns:
         return _config_cache
     try:
         with open(config_file, "r", encoding="utf-8") as f:
             _config_cache = json.load(f) or {}
-            _config_mtime = current_mtime
+            _config_mtime_ns = st.st_mtime_ns
         return _config_cache
     except Exception:
         return {}
 
 def clear_config_cache() -> None:
     """清除配置缓存"""
-    global _config_cache, _config_mtime
+    global _config_cache, _config_mtime_ns
     _config_cache = None
-    _config_mtime = None
+    _config_mtime_ns = None
 
 
 def validate_skill_name(name: str) -> Tuple[bool, str]:
     """验证技能名称安全性，防止路径遍历攻击"""
     if not name:
         return False, "技能名称不能为空"
-    # 检测路径遍历字符
-    dangerous = ['..', '\\', '/', '\x00']
-    if any(d in name for d in dangerous):
+    # 快路径：合法名称一次判断直接通过。kebab 字符集本身排除了
+    # 路径遍历字符（. \\ / 空字符），无需单独扫描
+    if len(name) <= MAX_NAME_LENGTH and _is_kebab_name(name):
+        return True, ""
+    # 失败路径：按原有优先级给出具体原因
+    if '..' in name or '\\' in name or '/' in name or '\x00' in name:
         return False, f"技能名称包含非法字符: {name}"
-    # 检查长度
     if len(name) > MAX_NAME_LENGTH:
         return False, f"技能名称过长 (最多 {MAX_NAME_LENGTH} 字符)"
-    # 检查符合命名规范
-    if not SKILL_NAME_PATTERN.match(name):
-        return False, f"技能名称不符合规范 (小写字母、数字、连字符): {name}"
-    return True, ""
+    return False, f"技能名称不符合规范 (小写字母、数字、连字符): {name}"
 
 
 # =============================================================================
@@ -1640,7 +2111,25 @@ def _process_input_source(
         return [], f"GitHub 源需要先使用 clone_manager 处理\n请运行: python bin/clone_manager.py clone {input_source}"
 
     elif input_type == "local":
-        return [Path(input_source)], None
+        source_root = Path(input_source)
+        # 清单快路径：发布方在根目录提供 skill.json 时，直接按声明路径
+        # 解析技能列表，免去对目录树的逐层扫描
+        manifest = source_root / "skill.json"
+        if manifest.exists():
+            try:
+                data = _loads(manifest.read_bytes())
+                declared = [
+                    source_root / entry["path"]
+                    for entry in data.get("skills", [])
+                    if entry.get("path")
+                ]
+                declared = [p for p in declared if p.is_dir()]
+                if declared:
+                    info(f"使用 skill.json 清单: {len(declared)} 个技能")
+                    return declared, None
+            except Exception:
+                pass  # 清单损坏时回退为普通目录处理
+        return [source_root], None
 
     elif input_type == "skill-package":
         extract_ok, extracted_dir = SkillPackHandler.extract_pack(Path(input_source), temp_dir / "extracted")
@@ -1659,6 +2148,9 @@ def _process_input_source(
 class SkillPackHandler:
     """处理 .skill 打包文件"""
 
+    # 解压时跳过的无用内容（安装不需要，省去解压 CPU 和磁盘写入）
+    EXTRACT_SKIP_PATTERNS = ("__pycache__/", "node_modules/", ".git/", ".pyc")
+
     @staticmethod
     def extract_pack(pack_file: Path, target_dir: Path) -> Tuple[bool, Path]:
         """
@@ -1671,6 +2163,7 @@ class SkillPackHandler:
 
         target_dir.mkdir(parents=True, exist_ok=True)
 
+        import zipfile
         try:
             with zipfile.ZipFile(pack_file, "r") as zip_ref:
                 # ZIP Slip 防护: 验证所有路径都在目标目录内
@@ -1680,7 +2173,13 @@ class SkillPackHandler:
                     # 确保解析后的路径以 target_dir 开头
                     if not str(member_path).startswith(str(target_dir.resolve())):
                         raise ValueError(f"ZIP Slip 检测: {member.filename} 试图跳出目标目录")
-                zip_ref.extractall(target_dir)
+                # 逐成员流式解压，跳过无用内容（整包 extractall 会把
+                # __pycache__/.git 等也解压到磁盘）
+                skip = SkillPackHandler.EXTRACT_SKIP_PATTERNS
+                for member in zip_ref.infolist():
+                    if any(p in member.filename for p in skip):
+                        continue
+                    zip_ref.extract(member, target_dir)
 
             # 找到实际的技能目录（可能包含在根目录中）
             extracted_items = list(target_dir.iterdir())
@@ -1711,6 +2210,9 @@ class SkillSearcher:
     _skill_index: Optional[Dict[str, Dict]] = None
     _index_mtime: Optional[float] = None
 
+    # 持久化索引文件：跨进程复用，避免每次 CLI 调用都全量扫描技能目录
+    INDEX_FILE = BASE_DIR / ".claude" / "memory" / "skill_index.json"
+
     @staticmethod
     def _get_dir_mtime() -> Optional[float]:
         """获取技能目录的最新修改时间"""
@@ -1722,6 +2224,35 @@ class SkillSearcher:
         except Exception:
             return None
 
+    @staticmethod
+    def _read_frontmatter_only(path: Path, max_bytes: int = 4096) -> str:
+        """只读取 SKILL.md 开头的 frontmatter 部分
+
+        SKILL.md 正文可能有几十 KB，但 frontmatter 总在文件头部。
+        逐行读到第二个 ``---`` 分隔符（或读满 max_bytes）即停止，
+        避免索引构建时整文件读入。
+
+        Returns:
+            包含 frontmatter 的文件头部内容
+        """
+        lines = []
+        consumed = 0
+        markers = 0
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                for line in f:
+                    lines.append(line)
+                    consumed += len(line)
+                    if line.strip() == "---":
+                        markers += 1
+                        if markers >= 2:
+                            break
+                    if consumed >= max_bytes:
+                        break
+        except (OSError, IOError):
+            return ""
+        return "".join(lines)
+
     @staticmethod
     def _build_skill_index() -> Dict[str, Dict]:
         """
@@ -1747,19 +2278,18 @@ class SkillSearcher:
         if not CLAUDE_SKILLS_DIR.exists():
             return {"skills": {}, "mtime": 0}
 
-        # 从数据库读取 parent_repo 映射
+        # 从数据库读取 parent_repo 映射（tinydb 不可用时 db 为 None，直接跳过）
         repo_map = {}
-        if TINYDB_AVAILABLE:
-            try:
-                with db_connection() as (db, Skill):
-                    if db:
-                        for record in db.all():
-                            folder = record.get("folder_name", "")
-                            parent_repo = record.get("parent_repo", "")
-                            if parent_repo:
-                                repo_map[folder] = parent_repo
-            except Exception:
-                pass
+        try:
+            with db_connection() as (db, Skill):
+                if db:
+                    for record in db.all():
+                        folder = record.get("folder_name", "")
+                        parent_repo = record.get("parent_repo", "")
+                        if parent_repo:
+                            repo_map[folder] = parent_repo
+        except Exception:
+            pass
 
         skills = {}
         for skill_dir in CLAUDE_SKILLS_DIR.iterdir():
@@ -1771,8 +2301,10 @@ class SkillSearcher:
                 continue
 
             try:
-                with open(skill_md, "r", encoding="utf-8", errors="ignore") as f:
-                    frontmatter = SkillNormalizer.extract_frontmatter(f.read())
+                # 只读 frontmatter 头部，避免整文件读入
+                frontmatter = SkillNormalizer.extract_frontmatter(
+                    SkillSearcher._read_frontmatter_only(skill_md)
+                )
 
                 name = frontmatter.get("name", skill_dir.name)
                 description = frontmatter.get("description", "")
@@ -1788,15 +2320,32 @@ class SkillSearcher:
                 folder_name = skill_dir.name
                 parent_repo = repo_map.get(folder_name, "")
 
+                tags_list = tags if isinstance(tags, list) else [tags]
+                name_lower = name.lower()
+                description_lower = description.lower()
+                category_lower = category.lower()
+                tags_lower = str(tags_list).lower()
+                keywords_cn_lower = [k.lower() for k in keywords_cn]
+                parent_repo_lower = parent_repo.lower()
+
                 skills[name] = {
                     "name": name,
+                    "name_lower": name_lower,
                     "folder": folder_name,
-                    "description": description.lower(),
-                    "tags": tags if isinstance(tags, list) else [tags],
-                    "category": category.lower(),
+                    "description": description_lower,
+                    "tags": tags_list,
+                    "tags_lower": tags_lower,
+                    "category": category_lower,
                     "keywords_cn": keywords_cn,
+                    "keywords_cn_lower": keywords_cn_lower,
                     "description_raw": description,
-                    "parent_repo": parent_repo.lower()
+                    "parent_repo": parent_repo_lower,
+                    # 预计算搜索 blob：关键词不在 blob 中时可直接跳过所有字段检查
+                    "blob": "\0".join([
+                        name_lower, description_lower, tags_lower,
+                        category_lower, " ".join(keywords_cn_lower),
+                        parent_repo_lower,
+                    ]),
                 }
             except Exception:
                 # 跳过读取失败的技能
@@ -1807,11 +2356,39 @@ class SkillSearcher:
             "mtime": SkillSearcher._get_dir_mtime() or 0
         }
 
+    @staticmethod
+    def _load_persisted_index(current_mtime: Optional[float]) -> Optional[Dict[str, Dict]]:
+        """加载持久化索引（仅当未过期时）
+
+        Returns:
+            有效的索引数据，过期或不存在时返回 None
+        """
+        if current_mtime is None or not SkillSearcher.INDEX_FILE.exists():
+            return None
+        try:
+            data = _loads(SkillSearcher.INDEX_FILE.read_bytes())
+            if isinstance(data, dict) and "skills" in data and data.get("mtime", -1) >= current_mtime:
+                return data
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _save_persisted_index(index_data: Dict[str, Dict]) -> None:
+        """将索引写入持久化文件（失败时静默跳过，不影响搜索）"""
+        try:
+            SkillSearcher.INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(SkillSearcher.INDEX_FILE, "w", encoding="utf-8") as f:
+                json.dump(index_data, f, ensure_ascii=False)
+        except Exception:
+            pass
+
     @staticmethod
     def _get_skill_index() -> Dict[str, Dict]:
         """
         获取技能索引（带缓存）
 
+        三级策略：进程内缓存 → 持久化索引文件 → 全量重建。
         自动检测目录变化并重建索引
         """
         current_mtime = SkillSearcher._get_dir_mtime()
@@ -1824,9 +2401,17 @@ class SkillSearcher:
             # 缓存有效
             return SkillSearcher._skill_index
 
+        # 尝试持久化索引（跨进程复用，省去全量目录扫描）
+        persisted = SkillSearcher._load_persisted_index(current_mtime)
+        if persisted is not None:
+            SkillSearcher._skill_index = persisted
+            SkillSearcher._index_mtime = current_mtime
+            return SkillSearcher._skill_index
+
         # 缓存失效或不存在，重建索引
         SkillSearcher._skill_index = SkillSearcher._build_skill_index()
         SkillSearcher._index_mtime = current_mtime
+        SkillSearcher._save_persisted_index(SkillSearcher._skill_index)
         return SkillSearcher._skill_index
 
     @staticmethod
@@ -1834,6 +2419,10 @@ class SkillSearcher:
         """手动失效缓存（用于安装/卸载技能后）"""
         SkillSearcher._skill_index = None
         SkillSearcher._index_mtime = None
+        try:
+            SkillSearcher.INDEX_FILE.unlink()
+        except (FileNotFoundError, OSError):
+            pass
 
     @staticmethod
     def search_skills(keywords: List[str], limit: int = 10, repo_filter: str = "") -> List[Dict]:
@@ -1874,11 +2463,13 @@ class SkillSearcher:
         # 遍历索引数据（无需读取文件）
         for name, skill_data in skills.items():
             description = skill_data["description"]
-            tags = skill_data["tags"]
             category = skill_data["category"]
-            keywords_cn = skill_data["keywords_cn"]
             folder = skill_data["folder"]
             parent_repo = skill_data.get("parent_repo", "")
+            name_lower = skill_data["name_lower"]
+            tags_lower = skill_data["tags_lower"]
+            keywords_cn_lower = skill_data["keywords_cn_lower"]
+            blob = skill_data["blob"]
 
             # 仓库过滤：如果不匹配则跳过
             if normalized_repo_filter and normalized_repo_filter not in parent_repo:
@@ -1891,22 +2482,28 @@ class SkillSearcher:
 
             for keyword in keywords:
                 keyword_lower = keyword.lower()
+
+                # 快速排除：关键词不在预计算 blob 中时跳过所有字段检查
+                # （blob 含全部可匹配字段，单次 C 级子串扫描即可判定）
+                if keyword_lower not in blob:
+                    continue
+
                 matched = False
 
                 # 1. 名称完全匹配：100分
-                if name.lower() == keyword_lower:
+                if name_lower == keyword_lower:
                     total_score += 100
                     match_reasons.append(f"名称完全匹配: {keyword}")
                     matched = True
 
                 # 2. 名称前缀匹配：90分（高于包含）
-                elif name.lower().startswith(keyword_lower) and len(keyword_lower) >= 2:
+                elif name_lower.startswith(keyword_lower) and len(keyword_lower) >= 2:
                     total_score += 90
                     match_reasons.append(f"名称前缀: {keyword}")
                     matched = True
 
                 # 3. 名称包含：80分
-                elif keyword_lower in name.lower():
+                elif keyword_lower in name_lower:
                     total_score += 80
                     match_reasons.append(f"名称包含: {keyword}")
                     matched = True
@@ -1918,7 +2515,7 @@ class SkillSearcher:
                     matched = True
 
                 # 5. 中文关键词匹配：40分
-                elif any(keyword_lower in k.lower() for k in keywords_cn):
+                elif any(keyword_lower in k for k in keywords_cn_lower):
                     total_score += 40
                     match_reasons.append(f"中文关键词: {keyword}")
                     matched = True
@@ -1930,7 +2527,7 @@ class SkillSearcher:
                     matched = True
 
                 # 7. 标签匹配：30分
-                elif keyword_lower in str(tags).lower():
+                elif keyword_lower in tags_lower:
                     total_score += 30
                     match_reasons.append(f"标签匹配: {keyword}")
                     matched = True
@@ -1974,45 +2571,78 @@ class SkillSearcher:
         results.sort(key=lambda x: x["score"], reverse=True)
         return results[:limit]
 
+    # 使用频率存储：skill_usage.json 为压实基线，skill_usage.log 为追加日志
+    USAGE_FILE = BASE_DIR / ".claude" / "memory" / "skill_usage.json"
+    USAGE_LOG_FILE = BASE_DIR / ".claude" / "memory" / "skill_usage.log"
+    USAGE_LOG_MAX_BYTES = 64 * 1024  # 日志超过此大小时压实回 JSON
+
     @staticmethod
     def _load_usage_data() -> Dict[str, int]:
         """
-        加载技能使用频率数据
+        加载技能使用频率数据（JSON 基线 + 追加日志合并）
 
         Returns:
             {skill_name: usage_count}
         """
-        usage_file = BASE_DIR / ".claude" / "memory" / "skill_usage.json"
-        default_data = {}
+        usage_data: Dict[str, int] = {}
 
-        if not usage_file.exists():
-            return default_data
+        if SkillSearcher.USAGE_FILE.exists():
+            try:
+                with open(SkillSearcher.USAGE_FILE, "r", encoding="utf-8") as f:
+                    usage_data = json.load(f)
+            except Exception:
+                usage_data = {}
+
+        # 合并追加日志（每行一个技能名）
+        if SkillSearcher.USAGE_LOG_FILE.exists():
+            try:
+                with open(SkillSearcher.USAGE_LOG_FILE, "r", encoding="utf-8") as f:
+                    for line in f:
+                        name = line.strip()
+                        if name:
+                            usage_data[name] = usage_data.get(name, 0) + 1
+            except Exception:
+                pass
 
+        return usage_data
+
+    @staticmethod
+    def _compact_usage_log() -> None:
+        """将追加日志压实回 JSON 基线并清空日志"""
         try:
-            with open(usage_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return default_data
+            usage_data = SkillSearcher._load_usage_data()
+            with open(SkillSearcher.USAGE_FILE, "w", encoding="utf-8") as f:
+                json.dump(usage_data, f, ensure_ascii=False, indent=2)
+            SkillSearcher.USAGE_LOG_FILE.unlink()
+        except Exception as e:
+            warn(f"使用日志压实失败: {e}")
 
     @staticmethod
     def record_usage(skill_name: str) -> None:
         """
         记录技能使用（供 skills 子智能体调用）
 
+        O(1) 追加写入日志，避免每次调用都全量读改写 JSON；
+        日志过大时才触发一次压实。
+
         Args:
             skill_name: 技能名称
         """
-        usage_file = BASE_DIR / ".claude" / "memory" / "skill_usage.json"
-        usage_file.parent.mkdir(parents=True, exist_ok=True)
+        SkillSearcher.USAGE_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            usage_data = SkillSearcher._load_usage_data()
-            usage_data[skill_name] = usage_data.get(skill_name, 0) + 1
-
-            with open(usage_file, "w", encoding="utf-8") as f:
-                json.dump(usage_data, f, ensure_ascii=False, indent=2)
+            with open(SkillSearcher.USAGE_LOG_FILE, "a", encoding="utf-8") as f:
+                f.write(f"{skill_name}\n")
         except Exception as e:
             warn(f"记录使用失败: {e}")
+            return
+
+        # 周期性压实：日志超过阈值时合并回 JSON
+        try:
+            if SkillSearcher.USAGE_LOG_FILE.stat().st_size > SkillSearcher.USAGE_LOG_MAX_BYTES:
+                SkillSearcher._compact_usage_log()
+        except OSError:
+            pass
 
 
 # =============================================================================
@@ -2086,43 +2716,92 @@ def _build_threat_analysis_prompt(threatened_skills: List[Dict]) -> str:
 
 
 # =============================================================================
-# 主命令行界面
+# 热路径子命令实现（list/formats 被快速分发和 argparse 两条路径共用）
 # =============================================================================
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="技能管理器 - 安装、搜索、卸载技能",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-示例:
-  # 安装 GitHub 仓库中的技能
-  python bin/skill_manager.py install https://github.com/user/repo
+def _trunc_desc(desc: str, limit: int = 60) -> str:
+    """描述截断为单处实现，热循环里绑定为局部名使用"""
+    return desc[:limit] + "..." if len(desc) > limit else desc
 
-  # 安装指定子技能
-  python bin/skill_manager.py install https://github.com/user/repo --skill my-skill
 
-  # 批量安装仓库中所有技能
-  python bin/skill_manager.py install https://github.com/user/repo --batch
+@functools.lru_cache(maxsize=4)
+def _load_skills_db(path_str: str, mtime_ns: int) -> Dict:
+    """解析 skills.db JSON，按 (路径, mtime) 缓存，同进程内重复调用免重复解析"""
+    return _loads(Path(path_str).read_bytes())
 
-  # 搜索技能（关键词）
-  python bin/skill_manager.py search prompt
 
-  # 搜索技能（多关键词）
-  python bin/skill_manager.py search prompt optimize --score
+def _cmd_list(use_color: bool) -> int:
+    """list 子命令：列出已安装技能"""
+    # 直接从数据库读取
+    skills_data = []
+    if SKILLS_DB_FILE.exists():
+        db = _load_skills_db(str(SKILLS_DB_FILE), SKILLS_DB_FILE.stat().st_mtime_ns)
+        for skill_id, skill in db.get("_default", {}).items():
+            if skill.get("installed", False):
+                skills_data.append(skill)
 
-  # 列出所有已安装技能
-  python bin/skill_manager.py list
+    if use_color:
+        header("已安装技能列表")
 
-  # 卸载技能（同步数据库）
-  python bin/skill_manager.py uninstall my-skill
+    if not skills_data:
+        warn("无已安装技能")
+        return 0
 
-  # 验证已安装的技能
-  python bin/skill_manager.py validate .claude/skills/my-skill
-        """
-    )
+    print(f"共 {len(skills_data)} 个技能:\n")
+
+    # 输出拼成单个字符串一次写出：N 次 print = N 次 stdout 加锁 + 写调用
+    trunc = _trunc_desc
+    prefix = "  " if use_color else ""
+    out = []
+    append = out.append
+    for skill in skills_data:
+        name = skill.get("name", "未知")
+        desc_short = trunc(skill.get("description", "无描述"))
+        append(f"{prefix}[OK] {name}\n     {desc_short}\n")
+    sys.stdout.write("".join(out))
+
+    return 0
+
+
+def _cmd_formats() -> int:
+    """formats 子命令：列出支持的技能格式"""
+    header("支持的技能格式")
+
+    # 批量写出，避免每种格式多次 print 系统调用
+    out = [f"共 {len(SUPPORTED_FORMATS)} 种格式:\n\n"]
+    append = out.append
+    for fmt_id, fmt_data in SUPPORTED_FORMATS.items():
+        # 格式 ID 和名称
+        append(f"  {fmt_id}\n")
+        append(f"     名称: {fmt_data['name']}\n")
+
+        # 识别标记
+        markers = fmt_data.get('markers', [])
+        if markers:
+            append(f"     识别标记: {', '.join(markers)}\n")
+
+        # 处理器状态
+        if fmt_data.get('handler'):
+            append("     状态: 自定义处理器\n")
+        else:
+            append("     状态: 内置处理\n")
 
-    subparsers = parser.add_subparsers(dest="command", help="可用命令")
+        append("\n")
+    sys.stdout.write("".join(out))
 
+    print("提示: 遇到不支持的格式？")
+    print("查看贡献指南: docs/skill-formats-contribution-guide.md")
+
+    return 0
+
+
+# =============================================================================
+# 主命令行界面
+# =============================================================================
+# 子命令解析器惰性构建：每次调用只会执行一个子命令，
+# 注册表按需构建命中的解析器，其余仅在显示帮助时构建
+
+def _build_validate_parser(subparsers):
     # validate 命令
     validate_parser = subparsers.add_parser("validate", help="验证技能结构")
     validate_parser.add_argument(
@@ -2131,6 +2810,8 @@ def main():
         help="技能目录路径"
     )
 
+
+def _build_list_parser(subparsers):
     # list 命令
     list_parser = subparsers.add_parser("list", help="列出已安装的技能")
     list_parser.add_argument(
@@ -2139,6 +2820,8 @@ def main():
         help="启用颜色输出（默认为纯文本）"
     )
 
+
+def _build_search_parser(subparsers):
     # search 命令
     search_parser = subparsers.add_parser("search", help="搜索技能（关键词/描述/标签/仓库）")
     search_parser.add_argument(
@@ -2162,9 +2845,13 @@ def main():
         help="显示匹配分数"
     )
 
+
+def _build_formats_parser(subparsers):
     # formats 命令
-    formats_parser = subparsers.add_parser("formats", help="列出支持的技能格式")
+    subparsers.add_parser("formats", help="列出支持的技能格式")
+
 
+def _build_uninstall_parser(subparsers):
     # uninstall 命令 - 卸载技能（同步数据库）
     uninstall_parser = subparsers.add_parser("uninstall", help="卸载技能并同步数据库状态")
     uninstall_parser.add_argument(
@@ -2182,6 +2869,8 @@ def main():
         help="强制删除，不询问确认"
     )
 
+
+def _build_install_parser(subparsers):
     # install 命令 - 统一安装接口
     install_parser = subparsers.add_parser("install", help="统一安装接口（支持所有格式）")
     install_parser.add_argument(
@@ -2218,6 +2907,8 @@ def main():
         help="GitHub 仓库名（用于构建技能名称）"
     )
 
+
+def _build_record_parser(subparsers):
     # record 命令 - 记录技能使用
     record_parser = subparsers.add_parser("record", help="记录技能使用（用于搜索加权）")
     record_parser.add_argument(
@@ -2225,6 +2916,8 @@ def main():
         help="技能名称"
     )
 
+
+def _build_cache_parser(subparsers):
     # cache 命令 - 仓库缓存管理（路由到 clone_manager）
     cache_parser = subparsers.add_parser("cache", help="仓库缓存管理")
     cache_subparsers = cache_parser.add_subparsers(dest="cache_command", help="缓存操作")
@@ -2240,6 +2933,8 @@ def main():
     update_cache_parser = cache_subparsers.add_parser("update", help="更新指定仓库缓存")
     update_cache_parser.add_argument("url", help="GitHub 仓库 URL")
 
+
+def _build_verify_config_parser(subparsers):
     # verify-config 命令
     verify_parser = subparsers.add_parser("verify-config", help="验证配置文件")
     verify_parser.add_argument(
@@ -2248,6 +2943,79 @@ def main():
         help="自动修复常见配置问题"
     )
 
+
+SUBCOMMAND_BUILDERS = {
+    "validate": _build_validate_parser,
+    "list": _build_list_parser,
+    "search": _build_search_parser,
+    "formats": _build_formats_parser,
+    "uninstall": _build_uninstall_parser,
+    "install": _build_install_parser,
+    "record": _build_record_parser,
+    "cache": _build_cache_parser,
+    "verify-config": _build_verify_config_parser,
+}
+
+
+def main():
+    # 热路径快速分发：record/list/formats 参数简单且被智能体高频调用，
+    # 手动解析后直接执行，完全跳过 argparse 构建开销
+    argv = sys.argv[1:]
+    if argv:
+        if argv[0] == "record" and len(argv) == 2 and not argv[1].startswith("-"):
+            SkillSearcher.record_usage(argv[1])
+            success(f"已记录使用: {argv[1]}")
+            return 0
+        if argv[0] == "list" and all(a in ("--color", "-c") for a in argv[1:]):
+            return _cmd_list(use_color=bool(argv[1:]))
+        if argv[0] == "formats" and len(argv) == 1:
+            return _cmd_formats()
+
+    import argparse
+    import shutil
+
+    parser = argparse.ArgumentParser(
+        description="技能管理器 - 安装、搜索、卸载技能",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  # 安装 GitHub 仓库中的技能
+  python bin/skill_manager.py install https://github.com/user/repo
+
+  # 安装指定子技能
+  python bin/skill_manager.py install https://github.com/user/repo --skill my-skill
+
+  # 批量安装仓库中所有技能
+  python bin/skill_manager.py install https://github.com/user/repo --batch
+
+  # 搜索技能（关键词）
+  python bin/skill_manager.py search prompt
+
+  # 搜索技能（多关键词）
+  python bin/skill_manager.py search prompt optimize --score
+
+  # 列出所有已安装技能
+  python bin/skill_manager.py list
+
+  # 卸载技能（同步数据库）
+  python bin/skill_manager.py uninstall my-skill
+
+  # 验证已安装的技能
+  python bin/skill_manager.py validate .claude/skills/my-skill
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="可用命令")
+
+    # 惰性构建：命中子命令时只构建该解析器；
+    # 无参数/-h/未知命令时构建全部，保证帮助信息完整
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in SUBCOMMAND_BUILDERS:
+        SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for builder in SUBCOMMAND_BUILDERS.values():
+            builder(subparsers)
+
     args = parser.parse_args()
 
     # =============================================================================
@@ -2264,39 +3032,7 @@ def main():
             return 1
 
     elif args.command == "list":
-        # 直接从数据库读取
-        skills_data = []
-        if SKILLS_DB_FILE.exists():
-            with open(SKILLS_DB_FILE, "r", encoding="utf-8") as f:
-                db = json.load(f)
-                for skill_id, skill in db.get("_default", {}).items():
-                    if skill.get("installed", False):
-                        skills_data.append(skill)
-
-        use_color = args.color
-
-        if use_color:
-            header("已安装技能列表")
-
-        if not skills_data:
-            warn("无已安装技能")
-            return 0
-
-        print(f"共 {len(skills_data)} 个技能:\n")
-
-        for skill in skills_data:
-            name = skill.get("name", "未知")
-            desc = skill.get("description", "无描述")
-            desc_short = desc[:60] + "..." if len(desc) > 60 else desc
-
-            if use_color:
-                print(f"  [OK] {name}")
-                print(f"     {desc_short}")
-            else:
-                print(f"[OK] {name}")
-                print(f"     {desc_short}")
-
-        return 0
+        return _cmd_list(args.color)
 
     elif args.command == "search":
         header("技能搜索")
@@ -2317,48 +3053,23 @@ def main():
                 warn(f"未找到匹配技能: {' '.join(args.keywords)}")
             return 0
 
-        print(f"找到 {len(results)} 个匹配技能:\n")
-
+        # 批量写出，避免每条结果多次 print 系统调用
+        out = [f"找到 {len(results)} 个匹配技能:\n\n"]
+        append = out.append
         for i, result in enumerate(results, 1):
             score_str = f" ({result['score']}分)" if args.score else ""
-            print(f"  {i}. {result['name']}{score_str}")
+            append(f"  {i}. {result['name']}{score_str}\n")
 
             if args.score:
-                print(f"     匹配原因: {', '.join(result['reasons'])}")
+                append(f"     匹配原因: {', '.join(result['reasons'])}\n")
 
-            desc_short = result['description'][:60] + "..." if len(result['description']) > 60 else result['description']
-            print(f"     {desc_short}\n")
+            append(f"     {_trunc_desc(result['description'])}\n\n")
+        sys.stdout.write("".join(out))
 
         return 0
 
     elif args.command == "formats":
-        header("支持的技能格式")
-
-        print(f"共 {len(SUPPORTED_FORMATS)} 种格式:\n")
-
-        for fmt_id, fmt_data in SUPPORTED_FORMATS.items():
-            # 格式 ID 和名称
-            print(f"  {fmt_id}")
-            print(f"     名称: {fmt_data['name']}")
-
-            # 识别标记
-            markers = fmt_data.get('markers', [])
-            if markers:
-                print(f"     识别标记: {', '.join(markers)}")
-
-            # 处理器状态
-            handler = fmt_data.get('handler')
-            if handler:
-                print("     状态: 自定义处理器")
-            else:
-                print(f"     状态: 内置处理")
-
-            print()
-
-        print("提示: 遇到不支持的格式？")
-        print("查看贡献指南: docs/skill-formats-contribution-guide.md")
-
-        return 0
+        return _cmd_formats()
 
     elif args.command == "uninstall":
         header("技能卸载器")
@@ -2476,6 +3187,9 @@ def main():
     elif args.command == "install":
         header("技能安装器")
 
+        # 每次安装从干净的存在性缓存开始
+        invalidate_fs_cache()
+
         # 获取命令行参数
         github_author = getattr(args, "author", None)
         github_repo = getattr(args, "repo", None)
@@ -2485,7 +3199,9 @@ def main():
         all_skills_to_process = []
         scan_results = None
         threatened_skills = []
-        temp_dir = TEMP_DIR / f"installer_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # 纳秒时间戳保证唯一即可，免去 datetime 构造 + strftime 格式化，
+        # 且同秒内多次 install 不会撞名
+        temp_dir = TEMP_DIR / f"installer_{time.time_ns()}"
         temp_dir.mkdir(parents=True, exist_ok=True)
 
         # 遍历每个源
@@ -2529,41 +3245,56 @@ def main():
             return 1
 
         # 3. 处理每个技能（格式转换）
+        # 验证/检测/转换均为相互独立的 I/O 操作，多技能时并行处理；
+        # 日志先缓冲到列表，map 结束后在主线程按序输出，避免交错
         converted_skills = []
         # 路径映射：安装路径 -> 原始路径（用于获取 .meta.json）
         install_path_to_original = {}
 
-        for skill_dir in all_skills_to_process:
+        def _process_one(skill_dir):
             skill_name = skill_dir.name
-            info(f"\n处理技能: {skill_name}")
+            logs = [("info", f"\n处理技能: {skill_name}")]
 
             # 验证子目录是否是技能目录
             should_install, skip_reason = ProjectValidator.validate_subdirectory(skill_dir, args.force)
             if not should_install:
-                warn(f"跳过: {skill_name} - {skip_reason}")
-                continue
+                logs.append(("warn", f"跳过: {skill_name} - {skip_reason}"))
+                return logs, None, None
 
             # 检测格式
             format_type, markers = FormatDetector.detect_skill_format(skill_dir)
-            info(f"检测到格式: {format_type}")
+            logs.append(("info", f"检测到格式: {format_type}"))
 
             # 官方格式直接安装，其他格式转换
             if format_type == "official":
-                info("官方格式，直接安装")
+                logs.append(("info", "官方格式，直接安装"))
                 # 直接使用原始路径，保留 .meta.json 访问能力
-                converted_skills.append(skill_dir)
-                install_path_to_original[skill_dir] = skill_dir
-            else:
-                info("需要转换")
-                target_dir = temp_dir / "processed" / skill_name
-                convert_ok, msg = SkillNormalizer.convert_to_official_format(skill_dir, target_dir)
-                if convert_ok:
-                    success(msg)
-                    converted_skills.append(target_dir)
-                    # 记录原始路径，用于获取 .meta.json
-                    install_path_to_original[target_dir] = skill_dir
-                else:
-                    error(msg)
+                return logs, skill_dir, skill_dir
+
+            logs.append(("info", "需要转换"))
+            target_dir = temp_dir / "processed" / skill_name
+            convert_ok, msg = SkillNormalizer.convert_to_official_format(skill_dir, target_dir)
+            if convert_ok:
+                logs.append(("success", msg))
+                # 记录原始路径，用于获取 .meta.json
+                return logs, target_dir, skill_dir
+            logs.append(("error", msg))
+            return logs, None, None
+
+        if len(all_skills_to_process) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(all_skills_to_process))) as ex:
+                process_results = list(ex.map(_process_one, all_skills_to_process))
+        else:
+            process_results = [_process_one(d) for d in all_skills_to_process]
+
+        _log_funcs = {"info": info, "warn": warn, "success": success, "error": error}
+        for logs, install_path, original_path in process_results:
+            for level, msg in logs:
+                _log_funcs[level](msg)
+            if install_path is not None:
+                converted_skills.append(install_path)
+                install_path_to_original[install_path] = original_path
 
         # 4. 安装所有技能
         if converted_skills:
@@ -2606,11 +3337,7 @@ def main():
                 git_dir = temp_dir / "repo" / ".git"
                 if git_dir.exists():
                     try:
-                        for root, dirs, files in os.walk(git_dir):
-                            for d in dirs:
-                                os.chmod(os.path.join(root, d), 0o755)
-                            for f in files:
-                                os.chmod(os.path.join(root, f), 0o644)
+                        _force_writable(git_dir)
                         shutil.rmtree(git_dir)
                     except Exception:
                         pass